@@ -0,0 +1,21 @@
+@echo off
+rem Fast-path launcher for odooforge.
+rem
+rem Prints the help text without starting a Python interpreter and hands every
+rem other invocation to the real CLI. Keep the text below in sync with
+rem odooforge.cli.USAGE (tests/test_init.py checks this).
+if "%~1"=="-h" goto usage
+if "%~1"=="--help" goto usage
+python -m odooforge.cli %*
+exit /b %ERRORLEVEL%
+
+:usage
+echo Usage: odooforge [command]
+echo.
+echo Commands:
+echo   (none)          Start the OdooForge MCP server
+echo   init            Initialize current directory as an OdooForge workspace
+echo   init --update   Update workspace template files to latest version
+echo   -h              Show this help message
+echo.
+exit /b 0
@@ -0,0 +1,22 @@
+#!/bin/sh
+# Fast-path launcher for odooforge.
+#
+# Prints the help text without starting a Python interpreter and hands every
+# other invocation to the real CLI. Keep the text below in sync with
+# odooforge.cli.USAGE (tests/test_init.py checks this).
+case "$1" in
+    -h|--help)
+        cat <<'USAGE'
+Usage: odooforge [command]
+
+Commands:
+  (none)          Start the OdooForge MCP server
+  init            Initialize current directory as an OdooForge workspace
+  init --update   Update workspace template files to latest version
+  -h              Show this help message
+
+USAGE
+        exit 0
+        ;;
+esac
+exec "${PYTHON:-python3}" -m odooforge.cli "$@"
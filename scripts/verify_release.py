@@ -18,6 +18,22 @@ import threading
 import time
 import shutil
 
+# orjson decodes large tools/list payloads noticeably faster; it is optional
+# so the script still runs against a bare `pip install odooforge`.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+else:
+    def _dumps(obj):
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
 def verify_release():
     # Check if odooforge is available in path (via uvx or pip)
     executable = shutil.which("odooforge")
@@ -51,40 +67,86 @@ def verify_release():
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=sys.stderr,
-        text=True,
-        bufsize=1
+        bufsize=0
     )
 
     # Helper to send JSON-RPC message
     def send_request(method, params=None, id=1):
-        msg = {
-            "jsonrpc": "2.0",
-            "method": method,
-            "params": params or {},
-            "id": id
-        }
-        json_str = json.dumps(msg)
-        print(f"-> Sending {method}...")
-        process.stdin.write(json_str + "\n")
+        send_requests([(method, params, id)])
+
+    # Send several requests in one pipe write without waiting for replies.
+    # The MCP stdio server rejects JSON-RPC batch arrays, so the requests
+    # are pipelined as consecutive newline-delimited messages instead.
+    def send_requests(requests):
+        payload = bytearray()
+        for method, params, id in requests:
+            msg = {
+                "jsonrpc": "2.0",
+                "method": method,
+                "params": params or {},
+                "id": id
+            }
+            print(f"-> Sending {method}...")
+            payload += _dumps(msg) + b"\n"
+        process.stdin.write(payload)
         process.stdin.flush()
 
-    # Read stdout in loop
+    # Read stdout in chunks into one reusable buffer and split out
+    # newline-delimited messages, instead of allocating per readline().
+    buffer = bytearray()
+    stdout_fd = process.stdout.fileno()
+
+    def read_line():
+        while True:
+            end = buffer.find(b"\n")
+            if end != -1:
+                line = bytes(buffer[:end])
+                del buffer[:end + 1]
+                return line
+            chunk = os.read(stdout_fd, 65536)
+            if not chunk:
+                return None
+            buffer.extend(chunk)
+
     def read_response():
         while True:
-            line = process.stdout.readline()
-            if not line:
+            line = read_line()
+            if line is None:
                 break
             try:
-                data = json.loads(line)
+                data = _loads(line)
                 if "result" in data:
                     return data["result"]
                 if "error" in data:
                     print(f"❌ Error: {data['error']}")
                     return None
-            except json.JSONDecodeError:
+            except ValueError:
                 pass
         return None
 
+    # Collect the responses to pipelined requests, keyed by request id.
+    # Failed requests map to None.
+    def read_responses(ids):
+        pending = set(ids)
+        responses = {}
+        while pending:
+            line = read_line()
+            if line is None:
+                break
+            try:
+                data = _loads(line)
+            except ValueError:
+                continue
+            if not isinstance(data, dict) or data.get("id") not in pending:
+                continue
+            pending.discard(data["id"])
+            if "error" in data:
+                print(f"❌ Error: {data['error']}")
+                responses[data["id"]] = None
+            else:
+                responses[data["id"]] = data.get("result")
+        return responses
+
     # 1. Initialize
     send_request("initialize", {
         "protocolVersion": "2024-11-05",
@@ -100,10 +162,15 @@ def verify_release():
     server_info = init_result.get("serverInfo", {})
     print(f"✅ Connected to {server_info.get('name')} v{server_info.get('version')}")
 
-    # 2. List Tools
-    send_request("tools/list", {}, id=2)
-    tools_result = read_response()
-    
+    # 2. List tools and ping in a single write
+    send_requests([("tools/list", {}, 2), ("ping", {}, 3)])
+    responses = read_responses([2, 3])
+    tools_result = responses.get(2)
+
+    if responses.get(3) is None:
+        print("❌ Server did not answer ping")
+        sys.exit(1)
+
     if not tools_result or "tools" not in tools_result:
         print("❌ Failed to list tools")
         sys.exit(1)
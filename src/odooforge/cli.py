@@ -2,39 +2,49 @@
 
 from __future__ import annotations
 
-import logging
 import sys
 
+# Heavy imports (logging setup, the MCP server and every tool module) are
+# deferred to the branch that needs them so ``--help`` and ``init`` stay fast.
+
+USAGE = (
+    "Usage: odooforge [command]\n"
+    "\n"
+    "Commands:\n"
+    "  (none)          Start the OdooForge MCP server\n"
+    "  init            Initialize current directory as an OdooForge workspace\n"
+    "  init --update   Update workspace template files to latest version\n"
+    "  -h              Show this help message\n"
+)
+
 
 def main() -> None:
     """CLI entry point: ``odooforge`` runs the MCP server, ``odooforge init`` initializes a workspace."""
-    if len(sys.argv) > 1 and sys.argv[1] == "init":
+    command = sys.argv[1] if len(sys.argv) > 1 else None
+
+    if command in ("-h", "--help"):
+        _print_usage()
+        return
+
+    if command == "init":
         from odooforge.init import run_init
 
         update = "--update" in sys.argv[2:]
         run_init(update=update)
-    elif len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
-        _print_usage()
-    else:
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
-        )
-        from odooforge.server import mcp
+        return
+
+    import importlib
+    import logging
 
-        mcp.run()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s [%(name)s] %(levelname)s: %(message)s",
+    )
+    importlib.import_module("odooforge.server").mcp.run()
 
 
 def _print_usage() -> None:
-    print(
-        "Usage: odooforge [command]\n"
-        "\n"
-        "Commands:\n"
-        "  (none)          Start the OdooForge MCP server\n"
-        "  init            Initialize current directory as an OdooForge workspace\n"
-        "  init --update   Update workspace template files to latest version\n"
-        "  -h              Show this help message\n"
-    )
+    print(USAGE)
 
 
 if __name__ == "__main__":
@@ -1,3 +1,37 @@
 """Code generation package — generates complete installable Odoo 18 addon modules."""
 
 from __future__ import annotations
+
+import importlib
+from typing import Any
+
+# Public generator name -> submodule that defines it.  Submodules are only
+# imported when one of their generators is first accessed.
+_LAZY: dict[str, str] = {
+    "build_addon": "addon_builder",
+    "iter_addon_files": "addon_builder",
+    "write_addon": "addon_builder",
+    "generate_manifest": "manifest_gen",
+    "generate_models": "model_gen",
+    "generate_models_init": "model_gen",
+    "generate_top_init": "model_gen",
+    "generate_access_csv": "security_gen",
+    "generate_security_xml": "security_gen",
+    "generate_views": "view_gen",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
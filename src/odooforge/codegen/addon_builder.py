@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterator
+from pathlib import Path
 
-def build_addon(
+
+def iter_addon_files(
     module_name: str,
     models: list[dict],
     version: str = "18.0.1.0.0",
@@ -12,19 +16,21 @@ def build_addon(
     description: str = "",
     depends: list[str] | None = None,
     security_groups: list[dict] | None = None,
-) -> dict:
-    """Orchestrate all generators to produce a complete Odoo module.
+) -> Iterator[tuple[str, str]]:
+    """Yield ``(relative_path, content)`` for every file of the module.
 
-    Returns a dict with module_name, files (path -> content), and summary.
+    Files are generated one at a time, so callers that write them out as
+    they go never hold the whole module in memory.
     """
-    from odooforge.codegen.manifest_gen import generate_manifest
-    from odooforge.codegen.model_gen import (
+    from odooforge.codegen import (
+        generate_access_csv,
+        generate_manifest,
         generate_models,
         generate_models_init,
+        generate_security_xml,
         generate_top_init,
+        generate_views,
     )
-    from odooforge.codegen.security_gen import generate_access_csv, generate_security_xml
-    from odooforge.codegen.view_gen import generate_views
 
     # Auto-detect depends from model mixins
     if depends is None:
@@ -35,29 +41,31 @@ def build_addon(
                     if "mail" not in depends:
                         depends.append("mail")
 
-    files: dict[str, str] = {}
+    # Each technical name feeds several paths, the CSV and the manifest;
+    # interning lets all of them share one string per model.
+    tech_names = [sys.intern(model["name"].replace(".", "_")) for model in models]
 
     # Models
-    for model in models:
-        model_technical = model["name"].replace(".", "_")
-        files[f"models/{model_technical}.py"] = generate_models(model)
-    files["models/__init__.py"] = generate_models_init(models)
-    files["__init__.py"] = generate_top_init()
+    for model, model_technical in zip(models, tech_names):
+        yield f"models/{model_technical}.py", generate_models(model)
+    yield "models/__init__.py", generate_models_init(models)
+    yield "__init__.py", generate_top_init()
 
     # Views
-    for model in models:
-        model_technical = model["name"].replace(".", "_")
-        files[f"views/{model_technical}_views.xml"] = generate_views(model)
+    for model, model_technical in zip(models, tech_names):
+        yield f"views/{model_technical}_views.xml", generate_views(model)
 
     # Security
-    files["security/ir.model.access.csv"] = generate_access_csv(models, security_groups)
+    yield "security/ir.model.access.csv", generate_access_csv(
+        models, security_groups, tech_names=tech_names
+    )
     if security_groups:
-        files[f"security/{module_name}_security.xml"] = generate_security_xml(
+        yield f"security/{module_name}_security.xml", generate_security_xml(
             module_name, security_groups
         )
 
     # Manifest (last, so it knows all files)
-    files["__manifest__.py"] = generate_manifest(
+    yield "__manifest__.py", generate_manifest(
         module_name=module_name,
         version=version,
         author=author,
@@ -68,16 +76,76 @@ def build_addon(
         has_security=True,
         models=models,
         security_groups=security_groups,
+        tech_names=tech_names,
     )
 
+
+def _summarize(models: list[dict], security_groups: list[dict] | None, total_files: int) -> dict:
+    return {
+        "total_files": total_files,
+        "models": len(models),
+        "fields": sum(len(m.get("fields", [])) for m in models),
+        "views": len(models) * 3,  # form + tree + search per model
+        "security_groups": len(security_groups) if security_groups else 0,
+    }
+
+
+def build_addon(
+    module_name: str,
+    models: list[dict],
+    version: str = "18.0.1.0.0",
+    author: str = "OdooForge",
+    category: str = "Customizations",
+    description: str = "",
+    depends: list[str] | None = None,
+    security_groups: list[dict] | None = None,
+) -> dict:
+    """Orchestrate all generators to produce a complete Odoo module.
+
+    Returns a dict with module_name, files (path -> content), and summary.
+    """
+    files = dict(iter_addon_files(
+        module_name, models, version, author, category, description, depends, security_groups
+    ))
+
     return {
         "module_name": module_name,
         "files": files,
-        "summary": {
-            "total_files": len(files),
-            "models": len(models),
-            "fields": sum(len(m.get("fields", [])) for m in models),
-            "views": len(models) * 3,  # form + tree + search per model
-            "security_groups": len(security_groups) if security_groups else 0,
-        },
+        "summary": _summarize(models, security_groups, len(files)),
+    }
+
+
+def write_addon(
+    root_dir: str | Path,
+    module_name: str,
+    models: list[dict],
+    version: str = "18.0.1.0.0",
+    author: str = "OdooForge",
+    category: str = "Customizations",
+    description: str = "",
+    depends: list[str] | None = None,
+    security_groups: list[dict] | None = None,
+) -> dict:
+    """Generate the module straight to ``<root_dir>/<module_name>/``.
+
+    Each file is written as soon as it is generated, then released.
+    Returns a dict with module_name, path, files (relative paths written),
+    and summary.
+    """
+    addon_dir = Path(root_dir) / module_name
+    written: list[str] = []
+
+    for rel_path, content in iter_addon_files(
+        module_name, models, version, author, category, description, depends, security_groups
+    ):
+        path = addon_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+        written.append(rel_path)
+
+    return {
+        "module_name": module_name,
+        "path": str(addon_dir),
+        "files": written,
+        "summary": _summarize(models, security_groups, len(written)),
     }
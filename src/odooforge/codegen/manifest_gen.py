@@ -14,8 +14,13 @@ def generate_manifest(
     has_security: bool = True,
     models: list[dict] | None = None,
     security_groups: list[dict] | None = None,
+    tech_names: list[str] | None = None,
 ) -> str:
-    """Generate __manifest__.py content."""
+    """Generate __manifest__.py content.
+
+    *tech_names* may carry the precomputed underscored model names, in the
+    same order as *models*.
+    """
     data_files: list[str] = []
 
     if has_security:
@@ -24,9 +29,9 @@ def generate_manifest(
             data_files.append(f"security/{module_name}_security.xml")
 
     if has_views and models:
-        for model in models:
-            model_technical = model["name"].replace(".", "_")
-            data_files.append(f"views/{model_technical}_views.xml")
+        if tech_names is None:
+            tech_names = [model["name"].replace(".", "_") for model in models]
+        data_files.extend(f"views/{t}_views.xml" for t in tech_names)
 
     manifest = {
         "name": description or module_name,
@@ -41,8 +46,6 @@ def generate_manifest(
         "license": "LGPL-3",
     }
 
-    lines = ["{\n"]
-    for key, value in manifest.items():
-        lines.append(f"    {key!r}: {value!r},\n")
-    lines.append("}\n")
-    return "".join(lines)
+    # One key per line, the layout Odoo's own manifests use.  Every value is
+    # a str, bool or list of str, so repr() always yields a valid literal.
+    return "{\n" + "".join(f"    {key!r}: {value!r},\n" for key, value in manifest.items()) + "}\n"
@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
+import ast
+from functools import lru_cache
+from typing import Any
 
+
+@lru_cache(maxsize=1024)
 def _to_class_name(model_name: str) -> str:
     """Convert a dotted model name to a CamelCase class name.
 
@@ -14,47 +19,110 @@ def _to_class_name(model_name: str) -> str:
     return "".join(part.capitalize() for part in parts)
 
 
-# Field types that take a positional argument before keyword args
-_RELATIONAL_FIELDS = {"Many2one", "One2many", "Many2many"}
-_SELECTION_FIELD = "Selection"
+def _selection_args(field: dict) -> list[Any]:
+    return [field["selection"]] if "selection" in field else []
+
+
+def _relation_args(field: dict) -> list[Any]:
+    return [field["relation"]] if "relation" in field else []
+
+
+def _one2many_args(field: dict) -> list[Any]:
+    if "relation" not in field:
+        return []
+    args = [field["relation"]]
+    if "inverse_field" in field:
+        args.append(field["inverse_field"])
+    return args
+
+
+def _no_args(field: dict) -> list[Any]:
+    return []
+
+
+# Field types that take positional arguments before keyword args, mapped to
+# the builder for those arguments
+_POSITIONAL_ARG_BUILDERS = {
+    "Selection": _selection_args,
+    "Many2one": _relation_args,
+    "One2many": _one2many_args,
+    "Many2many": _relation_args,
+}
+
+# Model file skeleton — defined once at import and filled in per model
+_MODEL_HEADER_TEMPLATE = (
+    "from odoo import models, fields, api\n"
+    "\n"
+    "\n"
+    "class {class_name}(models.Model):"
+)
+
+
+def _literal(value: Any) -> ast.expr:
+    """Build the AST node for a plain literal (str, number, bool, None, list, tuple, dict)."""
+    if isinstance(value, list):
+        return ast.List(elts=[_literal(v) for v in value], ctx=ast.Load())
+    if isinstance(value, tuple):
+        return ast.Tuple(elts=[_literal(v) for v in value], ctx=ast.Load())
+    if isinstance(value, dict):
+        return ast.Dict(
+            keys=[_literal(k) for k in value],
+            values=[_literal(v) for v in value.values()],
+        )
+    return ast.Constant(value=value)
+
 
+def _double_quoted(value: str) -> str:
+    """Render a string literal with double quotes, as the old templates did.
 
-def _build_field_line(field: dict) -> str:
-    """Build a single field definition line."""
-    name = field["name"]
+    ``ast.unparse`` follows ``repr`` and prefers single quotes; swapping the
+    delimiters is only safe when the text holds no double quote, otherwise
+    the ``repr`` form is kept as is.
+    """
+    text = ast.unparse(ast.Constant(value=value))
+    if text.startswith("'") and '"' not in value:
+        return f'"{text[1:-1]}"'
+    return text
+
+
+def _assign(target: str, value: ast.expr) -> ast.Assign:
+    node = ast.Assign(targets=[ast.Name(id=target, ctx=ast.Store())], value=value)
+    return ast.fix_missing_locations(node)
+
+
+def _field_assignment(field: dict) -> ast.Assign:
+    """Build the ``name = fields.Type(...)`` statement for a single field."""
     ftype = field["type"]
-    positional_args: list[str] = []
-    kwargs: dict[str, str] = {}
-
-    if ftype == _SELECTION_FIELD and "selection" in field:
-        positional_args.append(repr(field["selection"]))
-    elif ftype == "Many2one" and "relation" in field:
-        positional_args.append(repr(field["relation"]))
-    elif ftype == "One2many" and "relation" in field:
-        positional_args.append(repr(field["relation"]))
-        if "inverse_field" in field:
-            positional_args.append(repr(field["inverse_field"]))
-    elif ftype == "Many2many" and "relation" in field:
-        positional_args.append(repr(field["relation"]))
+    positional_args = _POSITIONAL_ARG_BUILDERS.get(ftype, _no_args)(field)
+    kwargs: dict[str, Any] = {}
 
     if "string" in field:
-        kwargs["string"] = repr(field["string"])
+        kwargs["string"] = field["string"]
     if field.get("required"):
-        kwargs["required"] = "True"
+        kwargs["required"] = True
     if field.get("readonly"):
-        kwargs["readonly"] = "True"
+        kwargs["readonly"] = True
     if "help" in field:
-        kwargs["help"] = repr(field["help"])
+        kwargs["help"] = field["help"]
     if "default" in field:
-        kwargs["default"] = repr(field["default"])
+        kwargs["default"] = field["default"]
 
-    all_args = positional_args + [f"{k}={v}" for k, v in kwargs.items()]
-    args_str = ", ".join(all_args)
-    return f"    {name} = fields.{ftype}({args_str})"
+    call = ast.Call(
+        func=ast.Attribute(value=ast.Name(id="fields", ctx=ast.Load()), attr=ftype, ctx=ast.Load()),
+        args=[_literal(v) for v in positional_args],
+        keywords=[ast.keyword(arg=k, value=_literal(v)) for k, v in kwargs.items()],
+    )
+    return _assign(field["name"], call)
 
 
 def generate_models(model: dict) -> str:
-    """Generate a single model Python file."""
+    """Generate a single model Python file.
+
+    Fields and ``_inherit`` are built as AST nodes and rendered with
+    ``ast.unparse``; ``_name`` and ``_description`` keep the templates'
+    double quotes.  Either way, names, descriptions and defaults containing
+    quotes or backslashes always produce valid Python.
+    """
     model_name = model["name"]
     class_name = _to_class_name(model_name)
     description = model.get("description", model_name)
@@ -62,34 +130,23 @@ def generate_models(model: dict) -> str:
     model_fields = model.get("fields", [])
 
     lines = [
-        "from odoo import models, fields, api",
-        "",
-        "",
-        f"class {class_name}(models.Model):",
-        f'    _name = "{model_name}"',
-        f'    _description = "{description}"',
+        _MODEL_HEADER_TEMPLATE.format(class_name=class_name),
+        f"    _name = {_double_quoted(model_name)}",
+        f"    _description = {_double_quoted(description)}",
     ]
-
     if inherits:
-        lines.append(f"    _inherit = {inherits!r}")
-
+        lines.append(f"    {ast.unparse(_assign('_inherit', _literal(inherits)))}")
     lines.append("")
-
-    for field in model_fields:
-        lines.append(_build_field_line(field))
-
+    lines.extend(f"    {ast.unparse(_field_assignment(field))}" for field in model_fields)
     lines.append("")
     return "\n".join(lines)
 
 
 def generate_models_init(models: list[dict]) -> str:
     """Generate models/__init__.py that imports all model files."""
-    lines = []
-    for model in models:
-        module_name = model["name"].replace(".", "_")
-        lines.append(f"from . import {module_name}")
-    lines.append("")
-    return "\n".join(lines)
+    return "".join(
+        f"from . import {model['name'].replace('.', '_')}\n" for model in models
+    )
 
 
 def generate_top_init() -> str:
@@ -2,36 +2,69 @@
 
 from __future__ import annotations
 
+import csv
+import io
+
+_ACCESS_CSV_HEADER = (
+    "id", "name", "model_id:id", "group_id:id",
+    "perm_read", "perm_write", "perm_create", "perm_unlink",
+)
+
+# Security file skeletons — defined once at import and filled in per call
+_SECURITY_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<odoo>
+{records}
+</odoo>
+"""
+
+_GROUP_RECORD_TEMPLATE = (
+    '    <record id="{group_id}" model="res.groups">\n'
+    '        <field name="name">{desc}</field>{implied}\n'
+    "    </record>"
+)
+
+_IMPLIED_GROUP_TEMPLATE = (
+    '\n            <field name="implied_ids" eval="'
+    "[(4, ref('{implied_group}'))]"
+    '"/>'
+)
+
 
 def generate_access_csv(
     models: list[dict],
     security_groups: list[dict] | None = None,
+    tech_names: list[str] | None = None,
 ) -> str:
     """Generate security/ir.model.access.csv content.
 
     Creates user (read/write/create) and manager (full) access lines per model.
+    *tech_names* may carry the precomputed underscored model names, in the
+    same order as *models*.
     """
-    lines = ["id,name,model_id:id,group_id:id,perm_read,perm_write,perm_create,perm_unlink"]
-
-    for model in models:
-        model_technical = model["name"].replace(".", "_")
-        lines.append(
-            f"access_{model_technical}_user,"
-            f"{model['name']}.user,"
-            f"model_{model_technical},"
-            f"base.group_user,"
-            f"1,1,1,0"
-        )
-        lines.append(
-            f"access_{model_technical}_manager,"
-            f"{model['name']}.manager,"
-            f"model_{model_technical},"
-            f"base.group_system,"
-            f"1,1,1,1"
-        )
+    buf = io.StringIO()
+    writer = csv.writer(buf, lineterminator="\n")
+    writer.writerow(_ACCESS_CSV_HEADER)
+
+    if tech_names is None:
+        tech_names = [model["name"].replace(".", "_") for model in models]
+
+    for model, model_technical in zip(models, tech_names):
+        writer.writerow((
+            f"access_{model_technical}_user",
+            f"{model['name']}.user",
+            f"model_{model_technical}",
+            "base.group_user",
+            1, 1, 1, 0,
+        ))
+        writer.writerow((
+            f"access_{model_technical}_manager",
+            f"{model['name']}.manager",
+            f"model_{model_technical}",
+            "base.group_system",
+            1, 1, 1, 1,
+        ))
 
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def generate_security_xml(
@@ -47,21 +80,10 @@ def generate_security_xml(
 
         implied = ""
         if "implied_group" in group:
-            implied = (
-                f'\n            <field name="implied_ids" eval="'
-                f"[(4, ref('{group['implied_group']}'))]"
-                f'"/>'
-            )
+            implied = _IMPLIED_GROUP_TEMPLATE.format(implied_group=group["implied_group"])
 
         records.append(
-            f'    <record id="{group_id}" model="res.groups">\n'
-            f'        <field name="name">{desc}</field>{implied}\n'
-            f"    </record>"
+            _GROUP_RECORD_TEMPLATE.format(group_id=group_id, desc=desc, implied=implied)
         )
 
-    records_str = "\n\n".join(records)
-    return f"""<?xml version="1.0" encoding="UTF-8"?>
-<odoo>
-{records_str}
-</odoo>
-"""
+    return _SECURITY_XML_TEMPLATE.format(records="\n\n".join(records))
@@ -2,77 +2,22 @@
 
 from __future__ import annotations
 
+import re
+
 # Field types that are typically shown in tree/list views
-_TREE_FIELD_TYPES = {
+_TREE_FIELD_TYPES = frozenset({
     "Char", "Text", "Integer", "Float", "Boolean", "Date", "Datetime",
     "Selection", "Many2one", "Monetary",
-}
+})
 
 # Field types searchable in search views
-_SEARCH_FIELD_TYPES = {
+_SEARCH_FIELD_TYPES = frozenset({
     "Char", "Text", "Selection", "Many2one", "Date", "Datetime",
-}
-
-
-def _xml_escape(text: str) -> str:
-    """Escape special XML characters."""
-    return (
-        text
-        .replace("&", "&amp;")
-        .replace("<", "&lt;")
-        .replace(">", "&gt;")
-        .replace('"', "&quot;")
-        .replace("'", "&apos;")
-    )
-
-
-def generate_views(model: dict) -> str:
-    """Generate a complete views XML file for a model.
-
-    Includes tree, form, search views, an action, and a menu item.
-    """
-    model_name = model["name"]
-    model_technical = model_name.replace(".", "_")
-    description = model.get("description", model_name)
-    inherits = model.get("inherit", [])
-    model_fields = model.get("fields", [])
-    has_chatter = "mail.thread" in inherits or "mail.activity.mixin" in inherits
-
-    # Determine which fields go into each view
-    tree_fields = [f for f in model_fields if f.get("type") in _TREE_FIELD_TYPES]
-    search_fields = [f for f in model_fields if f.get("type") in _SEARCH_FIELD_TYPES]
-    form_fields = model_fields  # all fields in form
-
-    # -- Tree View --
-    tree_field_lines = "\n".join(
-        f'                <field name="{f["name"]}"/>' for f in tree_fields
-    )
+})
 
-    # -- Form View --
-    form_field_lines = "\n".join(
-        f'                        <field name="{f["name"]}"/>' for f in form_fields
-    )
 
-    chatter_section = ""
-    if has_chatter:
-        chatter_section = (
-            "\n                <div class=\"oe_chatter\">"
-            "\n                    <field name=\"message_follower_ids\"/>"
-            "\n                    <field name=\"activity_ids\"/>"
-            "\n                    <field name=\"message_ids\"/>"
-            "\n                </div>"
-        )
-
-    # -- Search View --
-    search_field_lines = "\n".join(
-        f'                <field name="{f["name"]}"/>' for f in search_fields
-    )
-
-    # Pluralize description for menu/action name
-    action_name = _xml_escape(description + "s" if not description.endswith("s") else description)
-    escaped_desc = _xml_escape(description)
-
-    xml = f"""<?xml version="1.0" encoding="UTF-8"?>
+# Views file skeleton — defined once at import and filled in per model
+_VIEWS_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
 <odoo>
     <!-- Tree View -->
     <record id="{model_technical}_view_tree" model="ir.ui.view">
@@ -122,4 +67,75 @@ def generate_views(model: dict) -> str:
     <menuitem id="{model_technical}_menu_root" name="{action_name}" action="{model_technical}_action"/>
 </odoo>
 """
-    return xml
+
+_CHATTER_SECTION = (
+    "\n                <div class=\"oe_chatter\">"
+    "\n                    <field name=\"message_follower_ids\"/>"
+    "\n                    <field name=\"activity_ids\"/>"
+    "\n                    <field name=\"message_ids\"/>"
+    "\n                </div>"
+)
+
+
+_XML_ESCAPE_RE = re.compile(r"[&<>\"']")
+_XML_ESCAPES = {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&apos;"}
+
+
+def _xml_escape(text: str) -> str:
+    """Escape special XML characters in a single scan."""
+    if _XML_ESCAPE_RE.search(text) is None:
+        return text
+    return _XML_ESCAPE_RE.sub(lambda m: _XML_ESCAPES[m.group()], text)
+
+
+def generate_views(model: dict) -> str:
+    """Generate a complete views XML file for a model.
+
+    Includes tree, form, search views, an action, and a menu item.
+    Every value interpolated into the skeleton is XML-escaped.
+    """
+    model_name = _xml_escape(model["name"])
+    model_technical = model_name.replace(".", "_")
+    description = model.get("description", model["name"])
+    inherits = model.get("inherit", [])
+    model_fields = model.get("fields", [])
+    has_chatter = "mail.thread" in inherits or "mail.activity.mixin" in inherits
+
+    # Sort fields into views in a single pass; each name is escaped once and
+    # shared by every view it appears in (the form shows all fields).
+    tree_names: list[str] = []
+    search_names: list[str] = []
+    form_names: list[str] = []
+    for f in model_fields:
+        name = _xml_escape(f["name"])
+        form_names.append(name)
+        ftype = f.get("type")
+        if ftype in _TREE_FIELD_TYPES:
+            tree_names.append(name)
+        if ftype in _SEARCH_FIELD_TYPES:
+            search_names.append(name)
+
+    tree_field_lines = "\n".join(
+        f'                <field name="{name}"/>' for name in tree_names
+    )
+    form_field_lines = "\n".join(
+        f'                        <field name="{name}"/>' for name in form_names
+    )
+    search_field_lines = "\n".join(
+        f'                <field name="{name}"/>' for name in search_names
+    )
+
+    chatter_section = _CHATTER_SECTION if has_chatter else ""
+
+    # Pluralize description for menu/action name
+    action_name = _xml_escape(description + "s" if not description.endswith("s") else description)
+
+    return _VIEWS_TEMPLATE.format(
+        model_name=model_name,
+        model_technical=model_technical,
+        tree_field_lines=tree_field_lines,
+        form_field_lines=form_field_lines,
+        chatter_section=chatter_section,
+        search_field_lines=search_field_lines,
+        action_name=action_name,
+    )
@@ -4,9 +4,31 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
+_PACKAGE_ROOT = Path(__file__).resolve().parent
+
+
+@lru_cache(maxsize=1)
+def _resolve_compose_path() -> str:
+    """Locate the bundled docker-compose.yml, or return "" if none is found.
+
+    The result only depends on where the package is installed, so it is
+    resolved once per process.
+    """
+    # 1. Try package data (pip install)
+    data_compose = _PACKAGE_ROOT / "data" / "docker-compose.yml"
+    if data_compose.is_file():
+        return str(data_compose)
+
+    # 2. Try source root (dev mode)
+    project_root = _PACKAGE_ROOT.parent.parent
+    dev_compose = project_root / "docker" / "docker-compose.yml"
+    if dev_compose.is_file():
+        return str(dev_compose)
+
+    return ""
 
 
 @dataclass(frozen=True)
@@ -35,27 +57,19 @@ class OdooForgeConfig:
     @classmethod
     def from_env(cls) -> OdooForgeConfig:
         """Load configuration from environment variables with sensible defaults."""
+        from dotenv import load_dotenv
+
         load_dotenv()
 
         # Resolve docker compose path — default to <project_root>/docker
-        compose_path = os.getenv("DOCKER_COMPOSE_PATH", "")
-        if not compose_path:
-            # 1. Try package data (pip install)
-            package_root = Path(__file__).resolve().parent
-            data_compose = package_root / "data" / "docker-compose.yml"
-            
-            if data_compose.exists():
-                compose_path = str(data_compose)
-            else:
-                # 2. Try source root (dev mode)
-                project_root = package_root.parent.parent
-                dev_compose = project_root / "docker" / "docker-compose.yml"
-                if dev_compose.exists():
-                    compose_path = str(dev_compose)
+        compose_path = os.getenv("DOCKER_COMPOSE_PATH", "") or _resolve_compose_path()
 
         snapshots_dir = os.getenv("ODOOFORGE_SNAPSHOTS_DIR", "")
         if not snapshots_dir and compose_path:
-            snapshots_dir = str(Path(compose_path) / "snapshots")
+            # Snapshots live next to docker-compose.yml (DOCKER_COMPOSE_PATH
+            # may name either the file or its directory).
+            compose_dir = compose_path if os.path.isdir(compose_path) else os.path.dirname(compose_path)
+            snapshots_dir = os.path.join(compose_dir, "snapshots")
 
         return cls(
             odoo_url=os.getenv("ODOO_URL", "http://localhost:8069"),
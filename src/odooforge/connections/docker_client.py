@@ -3,36 +3,175 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import copy
 import json
 import logging
+import re
 import shutil
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from odooforge.connections.pg_client import OdooPG
 
 logger = logging.getLogger(__name__)
 
+# orjson parses and serializes snapshot manifests and `compose ps` output
+# several times faster; it is optional (the "speedups" extra).
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _json_loads = orjson.loads
+
+    def _dump_manifest(manifest: dict) -> bytes:
+        return orjson.dumps(manifest, option=orjson.OPT_INDENT_2)
+else:
+    _json_loads = json.loads
+
+    def _dump_manifest(manifest: dict) -> bytes:
+        return json.dumps(manifest, indent=2).encode()
+
 # Timeout for Docker commands (seconds)
 _CMD_TIMEOUT = 120
 _HEALTH_TIMEOUT = 60
+# Overall budget shared by all steps of a snapshot create/restore
+_SNAPSHOT_TIMEOUT = 600
+# Modules per `odoo --stop-after-init` run in batch_modules_via_cli
+_CLI_MODULE_CHUNK = 100
+# How long a `docker compose ps` result is reused by status() (seconds)
+_PS_TTL = 1.0
+
+
+def _deadline(budget: float) -> float:
+    """Return the event-loop time at which a *budget* seconds from now expires."""
+    return asyncio.get_running_loop().time() + budget
+
+
+def _remaining(deadline: float) -> float:
+    """Seconds left until *deadline*; raises TimeoutError once it has passed."""
+    remaining = deadline - asyncio.get_running_loop().time()
+    if remaining <= 0:
+        raise TimeoutError("Operation exceeded its time budget")
+    return remaining
+
 
+# Stream buffer limit for `docker compose logs`; Odoo tracebacks can produce
+# single lines longer than asyncio's 64 KiB default.
+_LOG_LINE_LIMIT = 1024 * 1024
 
-async def _run(cmd: list[str], cwd: str | None = None, timeout: int = _CMD_TIMEOUT) -> tuple[int, str, str]:
-    """Run a subprocess command and return (returncode, stdout, stderr)."""
-    proc = await asyncio.create_subprocess_exec(
-        *cmd,
-        stdout=asyncio.subprocess.PIPE,
-        stderr=asyncio.subprocess.PIPE,
-        cwd=cwd,
-    )
+
+@lru_cache(maxsize=128)
+def _grep_pattern(grep: str) -> re.Pattern[str]:
+    """Compile a case-insensitive logs() filter once per distinct pattern."""
+    return re.compile(grep, re.IGNORECASE)
+
+
+def _file_size(path: Path) -> int:
+    return path.stat().st_size if path.exists() else 0
+
+
+def _parse_ps_output(stdout: str) -> list[dict]:
+    """Parse ``docker compose ps --format json`` output.
+
+    Newer Compose versions print one JSON array, older ones one object per
+    line.  Both are handled with a single ``json.loads``; unparseable lines
+    are only dropped one by one when that fails.
+    """
+    stripped = stdout.strip()
+    if not stripped:
+        return []
+    try:
+        if stripped.startswith("["):
+            return _json_loads(stripped)
+        lines = [line for line in stripped.splitlines() if line.strip()]
+        return _json_loads("[" + ",".join(lines) + "]")
+    except json.JSONDecodeError:
+        pass
+
+    containers = []
+    for line in stripped.splitlines():
+        try:
+            containers.append(_json_loads(line))
+        except json.JSONDecodeError:
+            continue
+    return containers
+
+
+def _scan_manifests(snapshots_dir: Path, db: str | None) -> list[dict]:
+    """Read every snapshot manifest, optionally filtered by database."""
+    if not snapshots_dir.exists():
+        return []
+
+    snapshots = []
+    for manifest_file in sorted(snapshots_dir.glob("*.json")):
+        try:
+            manifest = _json_loads(manifest_file.read_bytes())
+            if db is None or manifest.get("database") == db:
+                snapshots.append(manifest)
+        except (json.JSONDecodeError, OSError):
+            continue
+
+    return snapshots
+
+
+def _delete_snapshot_files(snapshots_dir: Path, name: str) -> int:
+    """Remove a snapshot's dump and manifest; return the bytes freed."""
+    dump_path = snapshots_dir / f"{name}.dump"
+    manifest_path = snapshots_dir / f"{name}.json"
+
+    freed = 0
+    if dump_path.exists():
+        freed = dump_path.stat().st_size
+        dump_path.unlink()
+    if manifest_path.exists():
+        manifest_path.unlink()
+    return freed
+
+
+async def _run(
+    cmd: list[str],
+    cwd: str | None = None,
+    timeout: float = _CMD_TIMEOUT,
+    stdin_path: Path | None = None,
+    stdout_path: Path | None = None,
+) -> tuple[int, str, str]:
+    """Run a subprocess command and return (returncode, stdout, stderr).
+
+    ``stdin_path``/``stdout_path`` connect the process straight to local
+    files, so large payloads such as database dumps never pass through
+    Python; stdout is then returned as an empty string.
+    """
+    with contextlib.ExitStack() as files:
+        stdin = files.enter_context(open(stdin_path, "rb")) if stdin_path else None
+        stdout_target = (
+            files.enter_context(open(stdout_path, "wb")) if stdout_path
+            else asyncio.subprocess.PIPE
+        )
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=stdin,
+            stdout=stdout_target,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=cwd,
+        )
+    # asyncio.timeout() cancels the current task in place, unlike wait_for()
+    # which wraps communicate() in an extra Task per command.
     try:
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
-    except asyncio.TimeoutError:
+        async with asyncio.timeout(timeout):
+            stdout, stderr = await proc.communicate()
+    except TimeoutError:
         proc.kill()
         await proc.communicate()
-        raise TimeoutError(f"Command timed out after {timeout}s: {' '.join(cmd)}")
+        raise TimeoutError(f"Command timed out after {timeout:g}s: {' '.join(cmd)}") from None
 
-    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+    stdout_text = stdout.decode(errors="replace") if stdout else ""
+    return proc.returncode, stdout_text, stderr.decode(errors="replace")
 
 
 class DockerError(Exception):
@@ -42,7 +181,7 @@ class DockerError(Exception):
 class OdooDocker:
     """Docker Compose wrapper for Odoo infrastructure management."""
 
-    def __init__(self, compose_path: str):
+    def __init__(self, compose_path: str, pg: OdooPG | None = None):
         path = Path(compose_path)
         
         if path.is_file():
@@ -53,6 +192,10 @@ class OdooDocker:
             self.compose_file = self.compose_dir / "docker-compose.yml"
 
         self._snapshots_dir = self.compose_dir / "snapshots"
+        # Direct PostgreSQL access lets restores skip the container for SQL
+        self._pg = pg
+        # (loop time, result) of the last `docker compose ps`
+        self._ps_cache: tuple[float, dict[str, Any]] | None = None
 
         if not self.compose_file.exists():
             raise DockerError(
@@ -74,6 +217,7 @@ class OdooDocker:
         cmd.append("--wait")
 
         rc, stdout, stderr = await _run(cmd, cwd=str(self.compose_dir), timeout=180)
+        self._ps_cache = None
         if rc != 0:
             raise DockerError(f"docker compose up failed:\n{stderr}")
 
@@ -90,6 +234,7 @@ class OdooDocker:
             cmd.append("-v")
 
         rc, stdout, stderr = await _run(cmd, cwd=str(self.compose_dir))
+        self._ps_cache = None
         if rc != 0:
             raise DockerError(f"docker compose down failed:\n{stderr}")
 
@@ -105,13 +250,24 @@ class OdooDocker:
             self._compose_cmd("restart", service),
             cwd=str(self.compose_dir),
         )
+        self._ps_cache = None
         if rc != 0:
             raise DockerError(f"Restart of '{service}' failed:\n{stderr}")
 
         return {"status": "restarted", "service": service}
 
     async def status(self) -> dict[str, Any]:
-        """Get container states, ports, health status."""
+        """Get container states, ports, health status.
+
+        Results are reused for ``_PS_TTL`` seconds so bursts of status checks
+        share one ``docker compose ps``; lifecycle calls drop the cache.  Each
+        caller gets its own copy, so changing one result cannot leak into
+        another.
+        """
+        now = asyncio.get_running_loop().time()
+        if self._ps_cache is not None and now - self._ps_cache[0] < _PS_TTL:
+            return copy.deepcopy(self._ps_cache[1])
+
         rc, stdout, stderr = await _run(
             self._compose_cmd("ps", "--format", "json"),
             cwd=str(self.compose_dir),
@@ -119,19 +275,14 @@ class OdooDocker:
         if rc != 0:
             raise DockerError(f"docker compose ps failed:\n{stderr}")
 
-        containers = []
-        for line in stdout.strip().splitlines():
-            line = line.strip()
-            if line:
-                try:
-                    containers.append(json.loads(line))
-                except json.JSONDecodeError:
-                    pass
+        containers = _parse_ps_output(stdout)
 
-        return {
+        result = {
             "running": len(containers) > 0,
             "containers": containers,
         }
+        self._ps_cache = (now, result)
+        return copy.deepcopy(result)
 
     async def logs(
         self,
@@ -145,21 +296,52 @@ class OdooDocker:
         if since:
             cmd.extend(["--since", since])
 
-        rc, stdout, stderr = await _run(cmd, cwd=str(self.compose_dir))
-
-        log_output = stdout or stderr
+        pattern = _grep_pattern(grep) if grep else None
 
-        if grep and log_output:
-            import re
-            pattern = re.compile(grep, re.IGNORECASE)
+        # Stream stdout and drop non-matching lines as they arrive, so a large
+        # --tail never has to be held in memory before filtering.
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=str(self.compose_dir),
+            limit=_LOG_LINE_LIMIT,
+        )
+        kept: list[str] = []
+        saw_stdout = False
+
+        async def read_stdout() -> None:
+            nonlocal saw_stdout
+            async for raw in proc.stdout:
+                saw_stdout = True
+                line = raw.decode(errors="replace")
+                if pattern is None or pattern.search(line):
+                    kept.append(line)
+
+        try:
+            async with asyncio.timeout(_CMD_TIMEOUT):
+                _, stderr = await asyncio.gather(read_stdout(), proc.stderr.read())
+                await proc.wait()
+        except TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise TimeoutError(f"Command timed out after {_CMD_TIMEOUT}s: {' '.join(cmd)}") from None
+
+        if saw_stdout:
+            if pattern is None:
+                return "".join(kept)
+            return "\n".join(line.rstrip("\r\n") for line in kept)
+
+        # Nothing on stdout: fall back to stderr, filtered the same way
+        log_output = stderr.decode(errors="replace")
+        if pattern is not None and log_output:
             log_output = "\n".join(
                 line for line in log_output.splitlines() if pattern.search(line)
             )
-
         return log_output
 
     async def exec_in_container(
-        self, service: str, command: str, timeout: int = _CMD_TIMEOUT
+        self, service: str, command: str, timeout: float = _CMD_TIMEOUT
     ) -> str:
         """Execute a command inside a running container."""
         cmd = self._compose_cmd("exec", "-T", service, "bash", "-c", command)
@@ -173,121 +355,158 @@ class OdooDocker:
 
     # ── Module management via CLI ───────────────────────────────────
 
-    async def install_module_via_cli(self, db: str, modules: list[str]) -> str:
-        """Install modules using Odoo CLI (more reliable than XML-RPC for large modules)."""
-        module_list = ",".join(modules)
-        cmd = self._compose_cmd(
-            "exec", "-T", "web",
-            "odoo", "-d", db, "-i", module_list, "--stop-after-init",
-        )
+    async def _odoo_cli(
+        self, db: str, install: list[str], upgrade: list[str], timeout: float = 300,
+    ) -> str:
+        """Run one ``odoo -i ... -u ... --stop-after-init`` in the web container."""
+        cmd = self._compose_cmd("exec", "-T", "web", "odoo", "-d", db)
+        if install:
+            cmd.extend(["-i", ",".join(install)])
+        if upgrade:
+            cmd.extend(["-u", ",".join(upgrade)])
+        cmd.append("--stop-after-init")
 
-        rc, stdout, stderr = await _run(
-            cmd, cwd=str(self.compose_dir), timeout=300,
-        )
+        rc, stdout, stderr = await _run(cmd, cwd=str(self.compose_dir), timeout=timeout)
 
         output = stderr or stdout  # Odoo logs to stderr
         if rc != 0:
+            action = "install" if not upgrade else "upgrade" if not install else "install/upgrade"
+            module_list = ",".join(install + upgrade)
             raise DockerError(
-                f"Module install failed for [{module_list}] on '{db}':\n{output[-2000:]}"
+                f"Module {action} failed for [{module_list}] on '{db}':\n{output[-2000:]}"
             )
         return output
 
+    async def install_module_via_cli(self, db: str, modules: list[str]) -> str:
+        """Install modules using Odoo CLI (more reliable than XML-RPC for large modules)."""
+        return await self._odoo_cli(db, list(modules), [])
+
     async def upgrade_module_via_cli(self, db: str, modules: list[str]) -> str:
         """Upgrade modules using Odoo CLI."""
-        module_list = ",".join(modules)
-        cmd = self._compose_cmd(
-            "exec", "-T", "web",
-            "odoo", "-d", db, "-u", module_list, "--stop-after-init",
-        )
+        return await self._odoo_cli(db, [], list(modules))
 
-        rc, stdout, stderr = await _run(
-            cmd, cwd=str(self.compose_dir), timeout=300,
-        )
-
-        output = stderr or stdout
-        if rc != 0:
-            raise DockerError(
-                f"Module upgrade failed for [{module_list}] on '{db}':\n{output[-2000:]}"
-            )
-        return output
+    async def batch_modules_via_cli(
+        self,
+        db: str,
+        install: list[str] | None = None,
+        upgrade: list[str] | None = None,
+        chunk: int = _CLI_MODULE_CHUNK,
+    ) -> str:
+        """Install and upgrade modules with as few Odoo CLI runs as possible.
+
+        Every run is a full Odoo cold start, so all modules go into a single
+        ``-i``/``-u`` invocation per ``chunk`` modules.  A failing run raises
+        DockerError naming only the modules of that chunk.
+        """
+        install = list(install or [])
+        upgrade = list(upgrade or [])
+        if chunk < 1:
+            raise ValueError("chunk must be at least 1")
+
+        outputs = []
+        pending = [(name, True) for name in install] + [(name, False) for name in upgrade]
+        for start in range(0, len(pending), chunk):
+            batch = pending[start:start + chunk]
+            outputs.append(await self._odoo_cli(
+                db,
+                [name for name, is_install in batch if is_install],
+                [name for name, is_install in batch if not is_install],
+            ))
+        return "\n".join(outputs)
 
     # ── Snapshot operations ─────────────────────────────────────────
 
     async def create_snapshot(self, db: str, name: str, description: str = "") -> dict[str, Any]:
         """Create a database snapshot via pg_dump in the postgres container."""
-        self._snapshots_dir.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(self._snapshots_dir.mkdir, parents=True, exist_ok=True)
 
         dump_file = f"{name}.dump"
-        container_path = f"/tmp/{dump_file}"
-
-        # pg_dump inside the container
-        await self.exec_in_container(
-            "db",
-            f"pg_dump -U odoo -Fc {db} -f {container_path}",
-            timeout=300,
-        )
-
-        # Copy dump out of container
         local_path = self._snapshots_dir / dump_file
-        rc, stdout, stderr = await _run(
-            ["docker", "compose", "-f", str(self.compose_file),
-             "cp", f"db:{container_path}", str(local_path)],
-            cwd=str(self.compose_dir),
-        )
-        if rc != 0:
-            raise DockerError(f"Failed to copy snapshot: {stderr}")
 
-        # Clean up temp file in container
-        await self.exec_in_container("db", f"rm -f {container_path}")
+        # Stream pg_dump's output straight into the local file; no temp dump
+        # inside the container and no `docker compose cp` round-trip.
+        try:
+            rc, _, stderr = await _run(
+                self._compose_cmd("exec", "-T", "db", "pg_dump", "-U", "odoo", "-Fc", db),
+                cwd=str(self.compose_dir),
+                timeout=_SNAPSHOT_TIMEOUT,
+                stdout_path=local_path,
+            )
+        except BaseException:
+            # A timeout or cancellation leaves a truncated dump that would
+            # pass for a valid snapshot; remove it before propagating.
+            local_path.unlink(missing_ok=True)
+            raise
+        if rc != 0:
+            await asyncio.to_thread(local_path.unlink, missing_ok=True)
+            raise DockerError(f"pg_dump of '{db}' failed (exit {rc}):\n{stderr}")
 
         # Write manifest
+        size_bytes = await asyncio.to_thread(_file_size, local_path)
         manifest = {
             "name": name,
             "database": db,
             "description": description,
             "created_at": datetime.now(timezone.utc).isoformat(),
             "dump_file": dump_file,
-            "size_bytes": local_path.stat().st_size if local_path.exists() else 0,
+            "size_bytes": size_bytes,
         }
         manifest_path = self._snapshots_dir / f"{name}.json"
-        manifest_path.write_text(json.dumps(manifest, indent=2))
+        await asyncio.to_thread(manifest_path.write_bytes, _dump_manifest(manifest))
 
         return manifest
 
     async def restore_snapshot(self, db: str, name: str) -> dict[str, Any]:
         """Restore a database from a snapshot."""
         dump_path = self._snapshots_dir / f"{name}.dump"
-        if not dump_path.exists():
+        if not await asyncio.to_thread(dump_path.exists):
             raise DockerError(f"Snapshot '{name}' not found at {dump_path}")
 
-        container_path = f"/tmp/{name}.dump"
+        deadline = _deadline(_SNAPSHOT_TIMEOUT)
+
+        # Terminate sessions, then drop and recreate the database.  With a
+        # direct PostgreSQL connection this needs no container exec at all;
+        # otherwise (or if that connection fails) the steps share one exec,
+        # since each `docker compose exec` pays CLI startup and attach.
+        recreated = False
+        if self._pg is not None:
+            # Already loaded by whoever built self._pg.
+            import asyncpg
 
-        # Copy dump into container
-        rc, _, stderr = await _run(
-            ["docker", "compose", "-f", str(self.compose_file),
-             "cp", str(dump_path), f"db:{container_path}"],
+            from odooforge.connections.pg_client import PGError
+
+            try:
+                async with asyncio.timeout(_remaining(deadline)):
+                    await self._pg.recreate_database(db)
+                recreated = True
+            except (PGError, asyncpg.InterfaceError, OSError) as e:
+                # Unreachable server, refused login or timeout (an OSError);
+                # anything else is a bug and propagates.
+                logger.warning("Direct PostgreSQL recreate of '%s' failed, using exec: %r", db, e)
+        if not recreated:
+            await self.exec_in_container(
+                "db",
+                " && ".join([
+                    f"psql -U odoo -d postgres -c \"SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname='{db}' AND pid <> pg_backend_pid();\"",
+                    f"dropdb -U odoo --if-exists {db}",
+                    f"createdb -U odoo {db}",
+                ]),
+                timeout=_remaining(deadline),
+            )
+
+        # Restore by feeding the local dump to pg_restore's stdin
+        rc, stdout, stderr = await _run(
+            self._compose_cmd(
+                "exec", "-T", "db", "pg_restore", "-U", "odoo", "-d", db, "--no-owner",
+            ),
             cwd=str(self.compose_dir),
+            timeout=_remaining(deadline),
+            stdin_path=dump_path,
         )
         if rc != 0:
-            raise DockerError(f"Failed to copy snapshot to container: {stderr}")
-
-        # Drop and recreate the database
-        await self.exec_in_container(
-            "db",
-            f"psql -U odoo -d postgres -c \"SELECT pg_terminate_backend(pid) FROM pg_stat_activity WHERE datname='{db}' AND pid <> pg_backend_pid();\"",
-        )
-        await self.exec_in_container("db", f"dropdb -U odoo --if-exists {db}")
-        await self.exec_in_container("db", f"createdb -U odoo {db}")
-
-        # Restore
-        await self.exec_in_container(
-            "db",
-            f"pg_restore -U odoo -d {db} --no-owner {container_path}",
-            timeout=300,
-        )
-
-        # Clean up
-        await self.exec_in_container("db", f"rm -f {container_path}")
+            raise DockerError(
+                f"pg_restore of '{name}' into '{db}' failed (exit {rc}):\n{stderr or stdout}"
+            )
 
         # Restart Odoo to pick up restored state
         await self.restart_service("web")
@@ -300,32 +519,11 @@ class OdooDocker:
 
     async def list_snapshots(self, db: str | None = None) -> list[dict]:
         """List available snapshots from the manifests directory."""
-        if not self._snapshots_dir.exists():
-            return []
-
-        snapshots = []
-        for manifest_file in sorted(self._snapshots_dir.glob("*.json")):
-            try:
-                manifest = json.loads(manifest_file.read_text())
-                if db is None or manifest.get("database") == db:
-                    snapshots.append(manifest)
-            except (json.JSONDecodeError, OSError):
-                continue
-
-        return snapshots
+        return await asyncio.to_thread(_scan_manifests, self._snapshots_dir, db)
 
     async def delete_snapshot(self, name: str) -> dict[str, Any]:
         """Delete a snapshot from disk."""
-        dump_path = self._snapshots_dir / f"{name}.dump"
-        manifest_path = self._snapshots_dir / f"{name}.json"
-
-        freed = 0
-        if dump_path.exists():
-            freed = dump_path.stat().st_size
-            dump_path.unlink()
-        if manifest_path.exists():
-            manifest_path.unlink()
-
+        freed = await asyncio.to_thread(_delete_snapshot_files, self._snapshots_dir, name)
         return {"status": "deleted", "name": name, "freed_bytes": freed}
 
     # ── Health ──────────────────────────────────────────────────────
@@ -334,17 +532,21 @@ class OdooDocker:
         """Poll until the Odoo web service is healthy."""
         import httpx
 
-        start = asyncio.get_event_loop().time()
         url = "http://localhost:8069/web/health"
 
-        while (asyncio.get_event_loop().time() - start) < timeout:
-            try:
-                async with httpx.AsyncClient() as client:
-                    resp = await client.get(url, timeout=5)
-                    if resp.status_code == 200:
-                        return True
-            except (httpx.ConnectError, httpx.ReadTimeout, OSError):
-                pass
-            await asyncio.sleep(2)
+        # One client for the whole poll so its connection pool is reused;
+        # the overall deadline is enforced by asyncio.timeout().
+        try:
+            async with asyncio.timeout(timeout), httpx.AsyncClient(timeout=5) as client:
+                while True:
+                    try:
+                        resp = await client.get(url)
+                        if resp.status_code == 200:
+                            return True
+                    except (httpx.ConnectError, httpx.ReadTimeout, OSError):
+                        pass
+                    await asyncio.sleep(2)
+        except TimeoutError:
+            pass
 
         raise DockerError(f"Odoo did not become healthy within {timeout}s")
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from pathlib import Path
 from typing import Any
 
 import asyncpg
@@ -34,56 +36,100 @@ class OdooPG:
         self.user = user
         self.password = password
         self.database = database
-        self._pool: asyncpg.Pool | None = None
+        # One pool per database, so alternating between databases never
+        # tears down and re-establishes connections.
+        self._pools: dict[str, asyncpg.Pool] = {}
+        self._pools_lock = asyncio.Lock()
+
+    @property
+    def _pool(self) -> asyncpg.Pool | None:
+        """Pool for the default database, if it has been opened."""
+        return self._pools.get(self.database)
 
     async def _get_pool(self, database: str | None = None) -> asyncpg.Pool:
-        """Get or create connection pool."""
+        """Get or create the connection pool for *database*."""
         db = database or self.database
-        # If database changed or pool doesn't exist, create new pool
-        if self._pool is None or db != self.database:
-            if self._pool is not None:
-                await self._pool.close()
-            self._pool = await asyncpg.create_pool(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=db,
-                min_size=1,
-                max_size=5,
-            )
-            self.database = db
-        return self._pool
-
-    async def close(self) -> None:
-        """Close the connection pool."""
-        if self._pool:
-            await self._pool.close()
-            self._pool = None
+        pool = self._pools.get(db)
+        if pool is not None:
+            return pool
+        async with self._pools_lock:
+            # Another task may have opened it while we waited
+            if db not in self._pools:
+                self._pools[db] = await asyncpg.create_pool(
+                    host=self.host,
+                    port=self.port,
+                    user=self.user,
+                    password=self.password,
+                    database=db,
+                    min_size=1,
+                    max_size=5,
+                )
+            return self._pools[db]
+
+    async def close(self, database: str | None = None) -> None:
+        """Close the pool for *database*, or every pool when not given."""
+        if database is not None:
+            pool = self._pools.pop(database, None)
+            if pool is not None:
+                await pool.close()
+            return
+        pools, self._pools = self._pools, {}
+        for pool in pools.values():
+            await pool.close()
 
     # ── Query methods ───────────────────────────────────────────────
 
+    async def _fetch(
+        self, sql: str, params: list | None = None, database: str | None = None
+    ) -> list[asyncpg.Record]:
+        """Execute a SELECT query and return the raw records.
+
+        asyncpg keeps a per-connection cache of prepared statements keyed by
+        the SQL text, so repeated queries reuse their server-side plan.
+        """
+        try:
+            pool = await self._get_pool(database)
+            async with pool.acquire() as conn:
+                if params:
+                    return await conn.fetch(sql, *params)
+                return await conn.fetch(sql)
+        except asyncpg.PostgresError as e:
+            raise PGError(f"Query failed: {e}") from e
+
     async def query(
         self, sql: str, params: list | None = None, database: str | None = None
     ) -> list[dict]:
         """Execute a SELECT query, return rows as dicts."""
-        pool = await self._get_pool(database)
+        return [dict(row) for row in await self._fetch(sql, params, database)]
+
+    async def query_copy(
+        self,
+        sql: str,
+        output: str | Path | Any,
+        params: list | None = None,
+        database: str | None = None,
+    ) -> str:
+        """Stream a SELECT to *output* as CSV with a header row via COPY.
+
+        *output* is a path or a binary file-like object.  Rows go straight
+        from the server to the output without becoming Python objects, which
+        suits large diagnostic exports.  Returns the COPY status string.
+        """
         try:
+            pool = await self._get_pool(database)
             async with pool.acquire() as conn:
-                if params:
-                    rows = await conn.fetch(sql, *params)
-                else:
-                    rows = await conn.fetch(sql)
-                return [dict(row) for row in rows]
+                return await conn.copy_from_query(
+                    sql, *(params or []), output=output, format="csv", header=True,
+                )
         except asyncpg.PostgresError as e:
-            raise PGError(f"Query failed: {e}") from e
+            raise PGError(f"COPY failed: {e}") from e
 
     async def execute(
         self, sql: str, params: list | None = None, database: str | None = None
     ) -> str:
         """Execute an INSERT/UPDATE/DELETE, return status string."""
-        pool = await self._get_pool(database)
         try:
+            pool = await self._get_pool(database)
             async with pool.acquire() as conn:
                 if params:
                     return await conn.execute(sql, *params)
@@ -106,12 +152,12 @@ class OdooPG:
     async def get_db_size(self, database: str | None = None) -> str:
         """Database size in human-readable format."""
         db = database or self.database
-        rows = await self.query(
+        rows = await self._fetch(
             "SELECT pg_size_pretty(pg_database_size($1)) AS size",
             [db],
             database="postgres",
         )
-        return rows[0]["size"] if rows else "unknown"
+        return rows[0][0] if rows else "unknown"
 
     async def get_table_sizes(
         self, limit: int = 20, database: str | None = None
@@ -145,12 +191,29 @@ class OdooPG:
             database=database,
         )
 
+    async def recreate_database(self, database: str) -> None:
+        """Terminate sessions on *database*, then drop and create it empty.
+
+        Runs over the maintenance connection to ``postgres``; our own pool
+        for *database* is closed first so it does not block the drop.
+        """
+        await self.close(database)
+        ident = '"' + database.replace('"', '""') + '"'
+        await self.execute(
+            "SELECT pg_terminate_backend(pid) FROM pg_stat_activity "
+            "WHERE datname = $1 AND pid <> pg_backend_pid()",
+            [database],
+            database="postgres",
+        )
+        await self.execute(f"DROP DATABASE IF EXISTS {ident}", database="postgres")
+        await self.execute(f"CREATE DATABASE {ident}", database="postgres")
+
     async def list_databases(self) -> list[str]:
         """List all non-template databases."""
-        rows = await self.query(
+        rows = await self._fetch(
             "SELECT datname FROM pg_database "
             "WHERE datistemplate = false AND datname != 'postgres' "
             "ORDER BY datname",
             database="postgres",
         )
-        return [row["datname"] for row in rows]
+        return [row[0] for row in rows]
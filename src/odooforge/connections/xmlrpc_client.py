@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import random
+import threading
 import time
 import xmlrpc.client
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import httpx
 
 logger = logging.getLogger(__name__)
 
@@ -18,24 +24,72 @@ class OdooRPCError(Exception):
         super().__init__(message)
 
 
+class _ThreadLocalTransport:
+    """Hand each thread its own keep-alive ``xmlrpc.client`` transport.
+
+    A stdlib transport caches a single HTTP connection and has no lock
+    around its request/response cycle, so it must not be shared between
+    threads.  Within a thread, every endpoint still reuses one connection.
+    """
+
+    def __init__(self, transport_cls: type[xmlrpc.client.Transport]):
+        self._transport_cls = transport_cls
+        self._local = threading.local()
+
+    def get(self) -> xmlrpc.client.Transport:
+        """Return the calling thread's transport, creating it on first use."""
+        transport = getattr(self._local, "transport", None)
+        if transport is None:
+            transport = self._local.transport = self._transport_cls()
+        return transport
+
+    def request(self, host: Any, handler: str, request_body: bytes, verbose: bool = False) -> Any:
+        return self.get().request(host, handler, request_body, verbose)
+
+    def close(self) -> None:
+        transport = getattr(self._local, "transport", None)
+        if transport is not None:
+            transport.close()
+
+
 class OdooRPC:
     """Thread-safe XML-RPC wrapper for Odoo with session caching.
 
-    All high-level Odoo data operations go through this client.
+    All high-level Odoo data operations go through this client.  The
+    blocking methods use ``xmlrpc.client``; ``authenticate_async`` and
+    ``execute_async`` speak the same protocol over ``httpx`` so async
+    callers can overlap calls with ``asyncio.gather``.
     """
 
+    # Upper bound (seconds) for the jittered retry backoff
+    max_backoff = 30
+
     def __init__(self, url: str, db: str = "", username: str = "admin", password: str = "admin"):
         self.url = url.rstrip("/")
         self.db = db
         self.username = username
         self.password = password
         self.uid: int | None = None
+        # One transport per thread, shared by every endpoint: each thread
+        # keeps a single HTTP/1.1 connection alive instead of one per proxy.
+        transport_cls = (
+            xmlrpc.client.SafeTransport if self.url.startswith("https")
+            else xmlrpc.client.Transport
+        )
+        self._transport = _ThreadLocalTransport(transport_cls)
         self._common = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/common", allow_none=True
+            f"{self.url}/xmlrpc/2/common", transport=self._transport, allow_none=True
         )
         self._object = xmlrpc.client.ServerProxy(
-            f"{self.url}/xmlrpc/2/object", allow_none=True
+            f"{self.url}/xmlrpc/2/object", transport=self._transport, allow_none=True
+        )
+        self._db = xmlrpc.client.ServerProxy(
+            f"{self.url}/xmlrpc/2/db", transport=self._transport, allow_none=True
         )
+        self._http: httpx.AsyncClient | None = None
+        # Serialize re-authentication so concurrent callers share one login
+        self._auth_lock = threading.Lock()
+        self._async_auth_lock = asyncio.Lock()
 
     # ── Authentication ──────────────────────────────────────────────
 
@@ -70,12 +124,19 @@ class OdooRPC:
             raise OdooRPCError("No database specified")
 
         if self.uid is None or target_db != self.db:
-            self.authenticate(target_db)
+            with self._auth_lock:
+                # Re-check: another thread may have authenticated meanwhile
+                if self.uid is None or target_db != self.db:
+                    self.authenticate(target_db)
 
         return target_db, self.uid  # type: ignore[return-value]
 
     # ── Core execute ────────────────────────────────────────────────
 
+    def _backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry *attempt*, so clients don't retry in lockstep."""
+        return random.uniform(0, min(self.max_backoff, 2 ** attempt))
+
     def execute(
         self,
         model: str,
@@ -104,9 +165,9 @@ class OdooRPC:
             except (ConnectionError, OSError, xmlrpc.client.ProtocolError) as e:
                 last_error = e
                 if attempt < max_retries - 1:
-                    wait = 2 ** attempt
+                    wait = self._backoff(attempt)
                     logger.warning(
-                        "Connection error on %s.%s (attempt %d/%d), retrying in %ds: %s",
+                        "Connection error on %s.%s (attempt %d/%d), retrying in %.1fs: %s",
                         model, method, attempt + 1, max_retries, wait, e,
                     )
                     time.sleep(wait)
@@ -116,6 +177,148 @@ class OdooRPC:
 
         raise OdooRPCError(f"Failed after {max_retries} attempts: {last_error}") from last_error
 
+    # ── Async execute (httpx) ───────────────────────────────────────
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Create the shared async HTTP client on first use."""
+        if self._http is None:
+            import httpx
+
+            self._http = httpx.AsyncClient(base_url=self.url, timeout=60)
+        return self._http
+
+    async def _call_async(self, service: str, method: str, *params: Any) -> Any:
+        """POST one XML-RPC call to ``/xmlrpc/2/<service>`` and return its result.
+
+        Raises ``xmlrpc.client.Fault`` and ``xmlrpc.client.ProtocolError``
+        exactly like ``ServerProxy`` would.
+        """
+        payload = xmlrpc.client.dumps(params, method, allow_none=True)
+        path = f"/xmlrpc/2/{service}"
+        resp = await self._http_client().post(
+            path,
+            content=payload.encode(),
+            headers={"Content-Type": "text/xml"},
+        )
+        if resp.status_code != 200:
+            raise xmlrpc.client.ProtocolError(
+                f"{self.url}{path}", resp.status_code, resp.reason_phrase, dict(resp.headers)
+            )
+        (result,), _ = xmlrpc.client.loads(resp.content)
+        return result
+
+    async def authenticate_async(self, db: str | None = None) -> int:
+        """Async variant of :meth:`authenticate`."""
+        import httpx
+
+        target_db = db or self.db
+        if not target_db:
+            raise OdooRPCError("No database specified for authentication")
+
+        try:
+            uid = await self._call_async(
+                "common", "authenticate", target_db, self.username, self.password, {}
+            )
+        except xmlrpc.client.Fault as e:
+            raise OdooRPCError(f"Authentication fault: {e.faultString}", e.faultCode) from e
+        except (httpx.HTTPError, OSError, xmlrpc.client.ProtocolError) as e:
+            raise OdooRPCError(f"Cannot connect to Odoo at {self.url}: {e}") from e
+
+        if not uid:
+            raise OdooRPCError(
+                f"Authentication failed for user '{self.username}' on database '{target_db}'. "
+                "Check credentials."
+            )
+
+        self.uid = uid
+        if db:
+            self.db = target_db
+        return uid
+
+    async def _ensure_auth_async(self, db: str | None = None) -> tuple[str, int]:
+        """Async variant of :meth:`_ensure_auth`."""
+        target_db = db or self.db
+        if not target_db:
+            raise OdooRPCError("No database specified")
+
+        if self.uid is None or target_db != self.db:
+            async with self._async_auth_lock:
+                # Re-check: another task may have authenticated meanwhile
+                if self.uid is None or target_db != self.db:
+                    await self.authenticate_async(target_db)
+
+        return target_db, self.uid  # type: ignore[return-value]
+
+    async def execute_async(
+        self,
+        model: str,
+        method: str,
+        *args: Any,
+        db: str | None = None,
+        max_retries: int = 3,
+        **kwargs: Any,
+    ) -> Any:
+        """Async execute_kw with the same retry semantics as :meth:`execute`.
+
+        Backoff uses ``asyncio.sleep`` so other tasks keep running.
+        """
+        import httpx
+
+        target_db, uid = await self._ensure_auth_async(db)
+
+        last_error: Exception | None = None
+        for attempt in range(max_retries):
+            try:
+                return await self._call_async(
+                    "object", "execute_kw",
+                    target_db, uid, self.password, model, method,
+                    list(args) if args else [],
+                    kwargs if kwargs else {},
+                )
+            except xmlrpc.client.Fault as e:
+                raise OdooRPCError(
+                    f"Odoo error on {model}.{method}: {e.faultString}",
+                    e.faultCode,
+                ) from e
+            except (httpx.TransportError, OSError, xmlrpc.client.ProtocolError) as e:
+                last_error = e
+                if attempt < max_retries - 1:
+                    wait = self._backoff(attempt)
+                    logger.warning(
+                        "Connection error on %s.%s (attempt %d/%d), retrying in %.1fs: %s",
+                        model, method, attempt + 1, max_retries, wait, e,
+                    )
+                    await asyncio.sleep(wait)
+                    # Re-authenticate in case Odoo restarted
+                    self.uid = None
+                    target_db, uid = await self._ensure_auth_async(target_db)
+
+        raise OdooRPCError(f"Failed after {max_retries} attempts: {last_error}") from last_error
+
+    async def multi_call_async(
+        self,
+        calls: list[tuple[str, str, list, dict]],
+        db: str | None = None,
+    ) -> list[Any]:
+        """Run several ``(model, method, args, kwargs)`` calls concurrently.
+
+        Authentication happens once up front; results come back in call order.
+        Odoo's XML-RPC endpoints do not implement ``system.multicall``, so the
+        calls are overlapped on the shared HTTP client instead of being packed
+        into one request.
+        """
+        target_db, _ = await self._ensure_auth_async(db)
+        return list(await asyncio.gather(*(
+            self.execute_async(model, method, *args, db=target_db, **kwargs)
+            for model, method, args, kwargs in calls
+        )))
+
+    async def aclose(self) -> None:
+        """Close the async HTTP client, if one was opened."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     # ── Convenience methods ─────────────────────────────────────────
 
     def search_read(
@@ -261,7 +464,7 @@ class OdooRPC:
 
     def _db_proxy(self) -> xmlrpc.client.ServerProxy:
         """Get the database management proxy."""
-        return xmlrpc.client.ServerProxy(f"{self.url}/xmlrpc/2/db", allow_none=True)
+        return self._db
 
     def db_list(self) -> list[str]:
         """List all databases."""
@@ -3,15 +3,35 @@
 from __future__ import annotations
 
 import importlib.resources
-import shutil
+import os
+import re
+import sys
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 # ── Result tracking ───────────────────────────────────────────────
 
-Result = tuple[str, str]  # (relative_path, "created" | "skipped" | "updated")
+Result = tuple[str, str]  # (relative_path, "created" | "skipped" | "updated" | "unchanged")
 
 # ── Templates ─────────────────────────────────────────────────────
 
+# Bundled skills and agents: (name, one-line summary for CLAUDE.md).
+_SKILLS: tuple[tuple[str, str], ...] = (
+    ("odoo-brainstorm", "Explore Odoo customization ideas"),
+    ("odoo-architect", "Design data models with best practices"),
+    ("odoo-debug", "Diagnose and fix Odoo issues"),
+    ("odoo-setup", "Full business deployment from natural language"),
+    ("odoo-data", "Import, create, and manage business data"),
+    ("odoo-report", "Build dashboards and analyze business data"),
+)
+_AGENTS: tuple[tuple[str, str], ...] = (
+    ("odoo-explorer", "Read-only instance scout (gathers state before planning)"),
+    ("odoo-executor", "Plan execution engine (with snapshot safety)"),
+    ("odoo-reviewer", "Post-execution validator (checks for regressions)"),
+    ("odoo-analyst", "Business data analyst (queries and insights)"),
+)
+
 _CLAUDE_MD = """\
 # OdooForge Workspace
 
@@ -65,28 +85,24 @@ OdooForge exposes 79 MCP tools across these categories:
 ## Skills
 
 The `.claude/skills/` directory contains Claude Code skills for guided workflows:
-- **/odoo-brainstorm** — Explore Odoo customization ideas
-- **/odoo-architect** — Design data models with best practices
-- **/odoo-debug** — Diagnose and fix Odoo issues
-- **/odoo-setup** — Full business deployment from natural language
-- **/odoo-data** — Import, create, and manage business data
-- **/odoo-report** — Build dashboards and analyze business data
+{skills}
 
 ## Agents
 
 The `.claude/agents/` directory contains specialist subagents:
-- **odoo-explorer** — Read-only instance scout (gathers state before planning)
-- **odoo-executor** — Plan execution engine (with snapshot safety)
-- **odoo-reviewer** — Post-execution validator (checks for regressions)
-- **odoo-analyst** — Business data analyst (queries and insights)
+{agents}
 
 ## Custom Addons
 
 Place custom Odoo modules in the `addons/` directory. They are automatically
 mounted into the Docker container at `/mnt/extra-addons`.
-"""
+""".format(
+    skills="\n".join(f"- **/{name}** — {summary}" for name, summary in _SKILLS),
+    agents="\n".join(f"- **{name}** — {summary}" for name, summary in _AGENTS),
+)
 
-_CURSOR_MCP_JSON = """\
+# Cursor and Windsurf read the same MCP server config format.
+_MCP_JSON = """\
 {
   "mcpServers": {
     "odooforge": {
@@ -97,16 +113,16 @@ _CURSOR_MCP_JSON = """\
 }
 """
 
-_WINDSURF_MCP_JSON = """\
-{
-  "mcpServers": {
-    "odooforge": {
-      "command": "uvx",
-      "args": ["odooforge"]
-    }
-  }
-}
-"""
+_GITIGNORE_MARKER = b"# OdooForge"
+
+# How much of the end of an existing .gitignore to check for the marker
+# before falling back to reading all of it.
+_GITIGNORE_TAIL = 4096
+
+# The OdooForge block: the marker line plus following lines, up to the next
+# non-comment entry after a blank line or trailing newlines at end of file.
+# ``[^\n]*`` keeps each repetition to one line.
+_GITIGNORE_SECTION_RE = re.compile(rb"# OdooForge\n(?:[^\n]*\n)*?(?=\n[^ \t#]|\n*\Z)")
 
 _GITIGNORE = """\
 # OdooForge
@@ -118,152 +134,295 @@ addons/*/
 docker/snapshots/
 """
 
+# Templates are written as bytes; encode them once at import.
+_CLAUDE_MD_BYTES = _CLAUDE_MD.encode()
+_MCP_JSON_BYTES = _MCP_JSON.encode()
+_GITIGNORE_BYTES = _GITIGNORE.encode()
+
 
 # ── Helpers ───────────────────────────────────────────────────────
 
+@lru_cache(maxsize=1)
 def _pkg_data() -> Path:
-    """Return the path to the bundled ``data/`` directory."""
+    """Return the path to the bundled ``data/`` directory (resolved once)."""
     return importlib.resources.files("odooforge") / "data"  # type: ignore[return-value]
 
 
-def _write_file(path: Path, content: str, results: list[Result], *, update: bool = False) -> None:
-    """Write *content* to *path*, optionally overwriting if *update* is set."""
-    rel = str(path)
-    if path.exists():
-        if update:
-            path.write_text(content)
-            results.append((rel, "updated"))
-        else:
-            results.append((rel, "skipped"))
-        return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content)
-    results.append((rel, "created"))
+@dataclass
+class _Plan:
+    """Files a run will produce, collected before anything touches disk.
 
+    Each step is ``(dst, src, content, update)``: *src* is a file to copy,
+    otherwise *content* is written.  Collecting first lets :meth:`apply`
+    learn what already exists with one ``scandir`` per directory instead of
+    a ``stat`` per file, and create only the directories that are missing.
+    """
 
-def _copy_file(src: Path, dst: Path, results: list[Result], *, update: bool = False) -> None:
-    """Copy *src* to *dst*, optionally overwriting if *update* is set."""
-    rel = str(dst)
-    if dst.exists():
-        if update:
-            shutil.copy2(src, dst)
-            results.append((rel, "updated"))
-        else:
-            results.append((rel, "skipped"))
+    steps: list[tuple[Path, Path | None, bytes | None, bool]] = field(default_factory=list)
+
+    def write(self, dst: Path, content: bytes, *, update: bool = False) -> None:
+        self.steps.append((dst, None, content, update))
+
+    def copy(self, src: Path, dst: Path, *, update: bool = False) -> None:
+        self.steps.append((dst, src, None, update))
+
+    def apply(self) -> list[Result]:
+        """Carry out every step and return its ``(path, status)`` results.
+
+        Directories are created up front, then files are written in plan
+        order.
+        """
+        parents = sorted({dst.parent for dst, _, _, _ in self.steps}, key=lambda p: len(p.parts))
+        ensured: set[Path] = set()
+        existing: set[Path] = set()
+        for parent in parents:
+            try:
+                with os.scandir(parent) as entries:
+                    existing.update(parent / entry.name for entry in entries)
+            except FileNotFoundError:
+                # A new directory is empty, so there is nothing to scan
+                _ensure_dir(parent, ensured)
+
+        # Existing files are skipped unless updating; every other step
+        # becomes a job whose status is known only once it has run.
+        results: list[Result] = []
+        for dst, src, content, update in self.steps:
+            exists = dst in existing
+            if exists and not update:
+                results.append((str(dst), "skipped"))
+            else:
+                results.append((str(dst), _run_step(dst, src, content, exists)))
+        return results
+
+
+def _run_step(dst: Path, src: Path | None, content: bytes | None, exists: bool) -> str:
+    """Carry out one step and return its status."""
+    if exists:
+        if content is None:
+            content = _read_bytes(src)  # type: ignore[arg-type]
+        # An update that changes nothing leaves the file, and its mtime,
+        # untouched so watchers and build tools see no change.
+        if _read_bytes(dst) == content:
+            return "unchanged"
+        _write_bytes(dst, content)
+        return "updated"
+    if src is not None:
+        # Templates need their bytes, not the package's mtime/mode.
+        _copy_file(src, dst)
+    else:
+        _write_bytes(dst, content)  # type: ignore[arg-type]
+    return "created"
+
+
+def _ensure_dir(path: Path, ensured: set[Path]) -> None:
+    """Create *path*, creating missing ancestors only when ``mkdir`` says so.
+
+    *ensured* remembers directories created during this run, so shared
+    ancestors such as ``.claude/`` are made once rather than once per file.
+    """
+    if path in ensured:
         return
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
-    results.append((rel, "created"))
+    try:
+        os.mkdir(path)
+    except FileNotFoundError:
+        _ensure_dir(path.parent, ensured)
+        os.mkdir(path)
+    except FileExistsError:
+        pass
+    ensured.add(path)
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+# Every bundled template fits in one read of this size.
+_SMALL_FILE = 64 * 1024
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _read_all(fd: int) -> bytes:
+    return b"".join(iter(lambda: os.read(fd, 65536), b""))
+
+
+def _read_bytes(path: Path) -> bytes:
+    """Read *path* through a raw file descriptor."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return _read_all(fd)
+    finally:
+        os.close(fd)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* through a raw file descriptor."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        _write_all(fd, data)
+    finally:
+        os.close(fd)
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy the bytes of *src* to *dst*, leaving metadata behind.
+
+    Small files take one ``read`` and one ``write``; anything larger is
+    handed to ``sendfile`` so the kernel moves the data.
+    """
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        size = os.fstat(src_fd).st_size
+        if size <= _SMALL_FILE:
+            _write_bytes(dst, os.read(src_fd, _SMALL_FILE))
+            return
+        dst_fd = os.open(dst, _WRITE_FLAGS, 0o666)
+        try:
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(dst_fd, src_fd, offset, size - offset)
+                    if not sent:
+                        break
+                    offset += sent
+            except (AttributeError, OSError):
+                # No file-to-file sendfile on this platform
+                if offset:
+                    raise
+                with open(src, "rb") as f:
+                    _write_all(dst_fd, f.read())
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
 
 
 # ── Section builders ──────────────────────────────────────────────
 
-def _copy_skills(target: Path, results: list[Result], *, update: bool = False) -> None:
+def _copy_skills(target: Path, plan: _Plan, *, update: bool = False) -> None:
     skills_src = _pkg_data() / "skills"
-    for name in ("odoo-brainstorm", "odoo-architect", "odoo-debug",
-                 "odoo-setup", "odoo-data", "odoo-report"):
-        _copy_file(
+    for name, _ in _SKILLS:
+        plan.copy(
             skills_src / name / "SKILL.md",
             target / ".claude" / "skills" / name / "SKILL.md",
-            results,
             update=update,
         )
 
 
-def _copy_agents(target: Path, results: list[Result], *, update: bool = False) -> None:
+def _copy_agents(target: Path, plan: _Plan, *, update: bool = False) -> None:
     agents_src = _pkg_data() / "agents"
-    for name in ("odoo-explorer", "odoo-executor", "odoo-reviewer", "odoo-analyst"):
-        _copy_file(
+    for name, _ in _AGENTS:
+        plan.copy(
             agents_src / f"{name}.md",
             target / ".claude" / "agents" / f"{name}.md",
-            results,
             update=update,
         )
 
 
-def _create_claude_md(target: Path, results: list[Result], *, update: bool = False) -> None:
-    _write_file(target / "CLAUDE.md", _CLAUDE_MD, results, update=update)
+def _create_claude_md(target: Path, plan: _Plan, *, update: bool = False) -> None:
+    plan.write(target / "CLAUDE.md", _CLAUDE_MD_BYTES, update=update)
 
 
-def _create_mcp_configs(target: Path, results: list[Result], *, update: bool = False) -> None:
-    _write_file(target / ".cursor" / "mcp.json", _CURSOR_MCP_JSON, results, update=update)
-    _write_file(target / ".windsurf" / "mcp.json", _WINDSURF_MCP_JSON, results, update=update)
+def _create_mcp_configs(target: Path, plan: _Plan, *, update: bool = False) -> None:
+    plan.write(target / ".cursor" / "mcp.json", _MCP_JSON_BYTES, update=update)
+    plan.write(target / ".windsurf" / "mcp.json", _MCP_JSON_BYTES, update=update)
 
 
-def _copy_env(target: Path, results: list[Result]) -> None:
+def _copy_env(target: Path, plan: _Plan) -> None:
     # Never overwrite .env — it contains user credentials.
-    _copy_file(_pkg_data() / ".env.example", target / ".env", results, update=False)
+    plan.copy(_pkg_data() / ".env.example", target / ".env", update=False)
 
 
-def _copy_docker(target: Path, results: list[Result], *, update: bool = False) -> None:
+def _copy_docker(target: Path, plan: _Plan, *, update: bool = False) -> None:
     data = _pkg_data()
-    _copy_file(data / "docker-compose.yml", target / "docker" / "docker-compose.yml", results, update=update)
-    _copy_file(data / "odoo.conf", target / "docker" / "odoo.conf", results, update=update)
+    plan.copy(data / "docker-compose.yml", target / "docker" / "docker-compose.yml", update=update)
+    plan.copy(data / "odoo.conf", target / "docker" / "odoo.conf", update=update)
 
 
-def _create_addons_dir(target: Path, results: list[Result]) -> None:
-    keep = target / "addons" / ".keep"
-    if keep.exists():
-        results.append((str(keep), "skipped"))
-        return
-    keep.parent.mkdir(parents=True, exist_ok=True)
-    keep.write_text("")
-    results.append((str(keep), "created"))
+def _create_addons_dir(target: Path, plan: _Plan) -> None:
+    plan.write(target / "addons" / ".keep", b"", update=False)
 
 
 def _create_gitignore(target: Path, results: list[Result], *, update: bool = False) -> None:
     gi = target / ".gitignore"
-    marker = "# OdooForge"
-    if gi.exists():
-        existing = gi.read_text()
-        if marker in existing:
-            if update:
-                # Replace the OdooForge section in-place
-                import re
-                replaced = re.sub(
-                    r"# OdooForge\n(?:.*\n)*?(?=\n[^ \t#]|\n*$|\Z)",
-                    _GITIGNORE,
-                    existing,
-                )
-                gi.write_text(replaced)
-                results.append((str(gi), "updated"))
-            else:
-                results.append((str(gi), "skipped"))
-            return
-        # Append OdooForge section
-        gi.write_text(existing.rstrip() + "\n\n" + _GITIGNORE)
-        results.append((str(gi), "created"))
-    else:
-        gi.write_text(_GITIGNORE)
+    try:
+        fd = os.open(gi, os.O_RDONLY)
+    except FileNotFoundError:
+        _write_bytes(gi, _GITIGNORE_BYTES)
         results.append((str(gi), "created"))
+        return
+    try:
+        if not update:
+            # The section is appended, so on a re-run the marker is almost
+            # always near the end; look there before reading the whole file.
+            size = os.fstat(fd).st_size
+            os.lseek(fd, max(size - _GITIGNORE_TAIL, 0), os.SEEK_SET)
+            if os.read(fd, _GITIGNORE_TAIL).rfind(_GITIGNORE_MARKER) != -1:
+                results.append((str(gi), "skipped"))
+                return
+            os.lseek(fd, 0, os.SEEK_SET)
+        data = _read_all(fd)
+    finally:
+        os.close(fd)
+
+    if data.rfind(_GITIGNORE_MARKER) != -1:
+        if update:
+            # Replace the OdooForge section in-place
+            new = _GITIGNORE_SECTION_RE.sub(_GITIGNORE_BYTES, data)
+            if new == data:
+                results.append((str(gi), "unchanged"))
+            else:
+                _write_bytes(gi, new)
+                results.append((str(gi), "updated"))
+        else:
+            results.append((str(gi), "skipped"))
+        return
+    # Append OdooForge section: drop trailing whitespace, then append,
+    # leaving the user's entries where they are.
+    fd = os.open(gi, os.O_WRONLY | os.O_APPEND)
+    try:
+        kept = len(data.rstrip())
+        if kept < len(data):
+            os.ftruncate(fd, kept)
+        _write_all(fd, b"\n\n" + _GITIGNORE_BYTES)
+    finally:
+        os.close(fd)
+    results.append((str(gi), "created"))
 
 
 # ── Summary ───────────────────────────────────────────────────────
 
+# status -> (summary heading, per-file marker), in print order
+_SUMMARY_SECTIONS = {
+    "created": ("Created {} file(s):", "+"),
+    "updated": ("Updated {} file(s):", "~"),
+    "unchanged": ("Unchanged {} file(s) (already up to date):", "="),
+    "skipped": ("Skipped {} file(s) (already exist):", "-"),
+}
+
+
 def _print_summary(target: Path, results: list[Result]) -> None:
-    created = [(p, s) for p, s in results if s == "created"]
-    updated = [(p, s) for p, s in results if s == "updated"]
-    skipped = [(p, s) for p, s in results if s == "skipped"]
-
-    print(f"\nOdooForge workspace initialized in {target.resolve()}\n")
-    if created:
-        print(f"  Created {len(created)} file(s):")
-        for p, _ in created:
-            print(f"    + {p}")
-    if updated:
-        print(f"  Updated {len(updated)} file(s):")
-        for p, _ in updated:
-            print(f"    ~ {p}")
-    if skipped:
-        print(f"  Skipped {len(skipped)} file(s) (already exist):")
-        for p, _ in skipped:
-            print(f"    - {p}")
-    print(
+    by_status: dict[str, list[str]] = {status: [] for status in _SUMMARY_SECTIONS}
+    for p, s in results:
+        by_status[s].append(p)
+
+    # Assemble the whole report and emit it with a single write.
+    lines = [f"\nOdooForge workspace initialized in {target.resolve()}\n"]
+    for status, (heading, marker) in _SUMMARY_SECTIONS.items():
+        paths = by_status[status]
+        if paths:
+            lines.append(f"  {heading.format(len(paths))}")
+            lines.extend(f"    {marker} {p}" for p in paths)
+    lines.append(
         "\nNext steps:\n"
         "  1. Edit .env with your Odoo connection details\n"
         "  2. cd docker && docker compose up -d\n"
         "  3. Start coding with your AI editor!\n"
     )
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 # ── Main ──────────────────────────────────────────────────────────
@@ -277,15 +436,17 @@ def run_init(target: Path | None = None, *, update: bool = False) -> list[Result
     Returns the list of ``(path, status)`` results for testing.
     """
     target = target or Path(".")
-    results: list[Result] = []
-
-    _copy_skills(target, results, update=update)
-    _copy_agents(target, results, update=update)
-    _create_claude_md(target, results, update=update)
-    _create_mcp_configs(target, results, update=update)
-    _copy_env(target, results)  # always update=False
-    _copy_docker(target, results, update=update)
-    _create_addons_dir(target, results)
+    plan = _Plan()
+
+    _copy_skills(target, plan, update=update)
+    _copy_agents(target, plan, update=update)
+    _create_claude_md(target, plan, update=update)
+    _create_mcp_configs(target, plan, update=update)
+    _copy_env(target, plan)  # always update=False
+    _copy_docker(target, plan, update=update)
+    _create_addons_dir(target, plan)
+    results = plan.apply()
+    # .gitignore is merged with existing content, so it runs after the plan
     _create_gitignore(target, results, update=update)
     _print_summary(target, results)
 
@@ -2,38 +2,60 @@
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Mapping
+from functools import cached_property
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from odooforge.knowledge.best_practices import _BestPractices
 
 
 class KnowledgeBase:
     """Central loader for all Odoo domain knowledge.
 
-    Lazy-imports each knowledge sub-module on first instantiation to keep
-    import cost low when the knowledge layer is not needed.
+    Each knowledge sub-module is imported the first time its getter is
+    called, so callers only pay for the knowledge they actually use.
     """
 
-    def __init__(self) -> None:
+    @cached_property
+    def _modules(self) -> Mapping[str, Any]:
         from odooforge.knowledge.modules import MODULES
+
+        return MODULES
+
+    @cached_property
+    def _dictionary(self) -> Mapping[str, Any]:
         from odooforge.knowledge.dictionary import DICTIONARY
+
+        return DICTIONARY
+
+    @cached_property
+    def _patterns(self) -> dict[str, Any]:
         from odooforge.knowledge.patterns import PATTERNS
+
+        return PATTERNS
+
+    @cached_property
+    def _best_practices(self) -> _BestPractices:
         from odooforge.knowledge.best_practices import BEST_PRACTICES
+
+        return BEST_PRACTICES
+
+    @cached_property
+    def _blueprints(self) -> Mapping[str, Mapping[str, Any]]:
         from odooforge.knowledge.blueprints import BLUEPRINTS
 
-        self._modules = MODULES
-        self._dictionary = DICTIONARY
-        self._patterns = PATTERNS
-        self._best_practices = BEST_PRACTICES
-        self._blueprints = BLUEPRINTS
+        return BLUEPRINTS
 
     # ── Module catalog ────────────────────────────────────────────
 
-    def get_modules(self) -> dict[str, Any]:
+    def get_modules(self) -> Mapping[str, Any]:
         """Return the full module knowledge catalog."""
         return self._modules
 
     # ── Business-to-Odoo dictionary ───────────────────────────────
 
-    def get_dictionary(self) -> dict[str, Any]:
+    def get_dictionary(self) -> Mapping[str, Any]:
         """Return business-term-to-Odoo-model mappings."""
         return self._dictionary
 
@@ -47,7 +69,11 @@ class KnowledgeBase:
 
     def get_best_practices(self) -> dict[str, Any]:
         """Return Odoo convention / best-practice rules."""
-        return self._best_practices
+        return self._best_practices.as_dict()
+
+    def get_best_practices_by_category(self, category: str) -> tuple[dict[str, str], ...]:
+        """Return the best-practice rules of a single category."""
+        return self._best_practices.by_category(category)
 
     # ── Industry blueprints ───────────────────────────────────────
 
@@ -55,10 +81,16 @@ class KnowledgeBase:
         """Return available blueprint IDs."""
         return list(self._blueprints.keys())
 
-    def get_blueprint(self, blueprint_id: str) -> dict[str, Any] | None:
-        """Return a single blueprint by ID, or None if not found."""
+    def get_blueprint(self, blueprint_id: str) -> Mapping[str, Any] | None:
+        """Return a single (read-only) blueprint by ID, or None if not found."""
         return self._blueprints.get(blueprint_id)
 
+    def get_blueprints_for_module(self, module_name: str) -> frozenset[str]:
+        """Return IDs of blueprints that require or suggest *module_name*."""
+        from odooforge.knowledge.blueprints import module_index
+
+        return module_index().get(module_name, frozenset())
+
 
 _kb: KnowledgeBase | None = None
 
@@ -0,0 +1,22 @@
+"""Inverted-index helper shared by the knowledge catalogs."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+
+def index_by(entries: Mapping[str, Mapping[str, Any]], key: str) -> dict[str, tuple[str, ...]]:
+    """Map each value of *key* to the names of the entries that carry it.
+
+    A tuple-valued field indexes its entry under every element.  Entries
+    without *key* are left out; names keep catalog order.
+    """
+    index: dict[str, list[str]] = {}
+    for name, entry in entries.items():
+        if key not in entry:
+            continue
+        values = entry[key]
+        for value in (values,) if isinstance(values, str) else values:
+            index.setdefault(value, []).append(name)
+    return {value: tuple(names) for value, names in index.items()}
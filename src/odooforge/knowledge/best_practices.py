@@ -2,266 +2,339 @@
 
 A structured collection of rules that an AI assistant should follow
 when configuring, customizing, or extending an Odoo instance.
+
+Rules are stored column-wise (one tuple per attribute) with a category
+index, so filtering by category is a dict lookup instead of a scan.  The
+legacy ``{"rules": ({...}, ...)}`` view is only built when asked for.
 """
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Iterator, Mapping
+from operator import itemgetter
 from typing import Any
 
-BEST_PRACTICES: dict[str, Any] = {
-    "rules": [
-        # ── Naming conventions (3) ────────────────────────────────
-        {
-            "category": "naming",
-            "rule": "Custom fields must use the x_ prefix",
-            "why": (
-                "Odoo reserves unprefixed field names for core modules. "
-                "The x_ prefix marks fields as user-created and prevents "
-                "conflicts during module upgrades."
-            ),
-            "example": "x_loyalty_tier, x_tax_exempt, x_delivery_window",
-        },
-        {
-            "category": "naming",
-            "rule": "Custom models must use the x_ prefix",
-            "why": (
-                "Like fields, custom model technical names must start with "
-                "x_ to distinguish them from core models and avoid upgrade "
-                "collisions."
-            ),
-            "example": "x_quality_check, x_booking_slot, x_maintenance_log",
-        },
-        {
-            "category": "naming",
-            "rule": "Use snake_case for technical names and Title Case for user-facing labels",
-            "why": (
-                "Odoo convention uses snake_case for technical names "
-                "(field names, model names) and Title Case for string labels "
-                "shown in the UI."
-            ),
-            "example": "Field name: x_delivery_date, Label: 'Delivery Date'",
-        },
-
-        # ── Model design (5) ─────────────────────────────────────
-        {
-            "category": "model_design",
-            "rule": "Extend existing models before creating new ones",
-            "why": (
-                "Adding fields to res.partner, product.template, or "
-                "sale.order is simpler and preserves existing workflows. "
-                "Only create new models when the data does not logically "
-                "belong on an existing model."
-            ),
-            "example": (
-                "Add x_allergens to product.template instead of creating "
-                "a separate x_product_allergen model."
-            ),
-        },
-        {
-            "category": "model_design",
-            "rule": "Add mail.thread inheritance for records that need discussion and tracking",
-            "why": (
-                "mail.thread provides the chatter (message log), email "
-                "integration, and field-change tracking that users expect "
-                "on business documents."
-            ),
-            "example": "Custom model x_maintenance_request should inherit mail.thread.",
-        },
-        {
-            "category": "model_design",
-            "rule": "Include a _rec_name or name field on every model",
-            "why": (
-                "Odoo uses _rec_name (defaults to 'name') for display in "
-                "dropdowns, breadcrumbs, and log messages. Without it, "
-                "records show as 'x_model,42' which is confusing."
-            ),
-            "example": "Always add a Char field 'x_name' or set _rec_name to a meaningful field.",
-        },
-        {
-            "category": "model_design",
-            "rule": "Use Selection fields for fixed-choice states, Many2one for user-configurable stages",
-            "why": (
-                "Selection fields are fast and simple for fixed workflows "
-                "(draft/confirmed/done). Many2one to a stage model is "
-                "better when users need to add/reorder stages."
-            ),
-            "example": (
-                "state = Selection for invoice status; stage_id = Many2one "
-                "for CRM pipeline stages."
-            ),
-        },
-        {
-            "category": "model_design",
-            "rule": "Always define _description on custom models",
-            "why": (
-                "The _description string appears in the UI (e.g., access "
-                "rights configuration, log entries). Without it, users "
-                "see the raw technical name."
-            ),
-            "example": "_description = 'Maintenance Request'",
-        },
-
-        # ── Fields (3) ───────────────────────────────────────────
-        {
-            "category": "fields",
-            "rule": "Set required=True only when the field is truly mandatory for business logic",
-            "why": (
-                "Over-requiring fields frustrates users and blocks imports. "
-                "Reserve required=True for fields the system cannot function without."
-            ),
-            "example": "name is required, but x_notes should not be.",
-        },
-        {
-            "category": "fields",
-            "rule": "Use Monetary fields (not Float) for all currency amounts",
-            "why": (
-                "Monetary fields automatically respect currency precision "
-                "and display the correct currency symbol. Float fields "
-                "can cause rounding errors in financial calculations."
-            ),
-            "example": "x_budget_amount = fields.Monetary(currency_field='currency_id')",
-        },
-        {
-            "category": "fields",
-            "rule": "Define string labels and help tooltips on every custom field",
-            "why": (
-                "Clear labels and help text make the UI self-documenting "
-                "and reduce support requests. The help text appears as "
-                "a tooltip on hover."
-            ),
-            "example": "x_lead_time = Integer(string='Lead Time (Days)', help='Average days from order to delivery')",
-        },
-
-        # ── Security (3) ─────────────────────────────────────────
-        {
-            "category": "security",
-            "rule": "Create access rights (ir.model.access) for every custom model",
-            "why": (
-                "Models without access rights are invisible to non-admin "
-                "users. Every model needs at least one ir.model.access "
-                "record per user group."
-            ),
-            "example": (
-                "Grant read/write/create to the user group and "
-                "read/write/create/unlink to the manager group."
-            ),
-        },
-        {
-            "category": "security",
-            "rule": "Use record rules (ir.rule) to restrict data by company in multi-company setups",
-            "why": (
-                "Without record rules, users in Company A can see and "
-                "modify Company B's data. Record rules enforce row-level "
-                "data isolation."
-            ),
-            "example": "domain_force: ['|', ('company_id', '=', False), ('company_id', 'in', company_ids)]",
-        },
-        {
-            "category": "security",
-            "rule": "Never give admin/superuser access to regular business users",
-            "why": (
-                "The admin account bypasses all security rules. Regular "
-                "users should be assigned to appropriate security groups "
-                "with the minimum necessary permissions."
-            ),
-            "example": "Create dedicated groups like 'Sales / User' and 'Sales / Manager'.",
-        },
-
-        # ── Views (3) ────────────────────────────────────────────
-        {
-            "category": "views",
-            "rule": "Always create both form and tree (list) views for custom models",
-            "why": (
-                "Tree views provide an overview for browsing records; "
-                "form views are needed for editing. Without both, the "
-                "user experience is incomplete."
-            ),
-            "example": "Create ir.ui.view records with type='form' and type='tree'.",
-        },
-        {
-            "category": "views",
-            "rule": "Use view inheritance (inherit_id) to modify existing views instead of replacing them",
-            "why": (
-                "Replacing a view loses all other customizations and "
-                "may break on upgrade. Inheritance uses XPath to surgically "
-                "add or modify specific elements."
-            ),
-            "example": "inherit_id = 'sale.view_order_form', arch uses xpath to add fields.",
-        },
-        {
-            "category": "views",
-            "rule": "Group related fields using <group> and <notebook>/<page> elements",
-            "why": (
-                "Organized forms are easier to use. Group related fields "
-                "together and use tabs (notebook pages) for secondary "
-                "information."
-            ),
-            "example": (
-                "Main info in the first group, financial details in a "
-                "second group, notes in a separate tab."
-            ),
-        },
-
-        # ── Automation (2) ───────────────────────────────────────
-        {
-            "category": "automation",
-            "rule": "Prefer server actions and automated rules over custom Python code",
-            "why": (
-                "Server actions and base.automation rules can be created "
-                "and modified through the UI without code deployment. "
-                "Use code only when the logic is too complex for declarative rules."
-            ),
-            "example": (
-                "Use an automated action to send an email when stage changes, "
-                "instead of overriding the write method."
-            ),
-        },
-        {
-            "category": "automation",
-            "rule": "Set appropriate triggers and filters on automated actions to avoid performance issues",
-            "why": (
-                "An automated action without a filter domain runs on every "
-                "record write, which can be very slow on large datasets. "
-                "Always include a filter to narrow the trigger scope."
-            ),
-            "example": (
-                "Filter: [('stage_id.name', '=', 'Won')] instead of "
-                "triggering on every crm.lead write."
-            ),
-        },
-
-        # ── Reports (1) ──────────────────────────────────────────
-        {
-            "category": "reports",
-            "rule": "Use QWeb templates for PDF reports and inherit existing report templates when possible",
-            "why": (
-                "QWeb is Odoo's native template engine for reports. "
-                "Inheriting existing templates (e.g., account.report_invoice) "
-                "preserves the standard layout while allowing targeted modifications."
-            ),
-            "example": "Inherit 'account.report_invoice_document' to add a custom footer.",
-        },
-
-        # ── Performance (2) ──────────────────────────────────────
-        {
-            "category": "performance",
-            "rule": "Add database indexes to fields used frequently in search domains and filters",
-            "why": (
-                "Fields used in domain filters, group-by operations, or "
-                "ORDER BY clauses benefit from indexing. Without indexes, "
-                "queries on large tables become slow."
-            ),
-            "example": "Set index=True on frequently-searched fields like x_region or x_status.",
-        },
-        {
-            "category": "performance",
-            "rule": "Use read_group instead of search_read when you only need aggregate data",
-            "why": (
-                "read_group performs aggregation at the database level "
-                "(SQL GROUP BY) which is far more efficient than fetching "
-                "all records and aggregating in Python."
-            ),
-            "example": "rpc.read_group('sale.order', [], ['amount_total:sum'], ['state'])",
-        },
-    ],
-}
+_FIELDS = ("category", "rule", "why", "example")
+
+# Written row by row for readability, transposed into columns at import.
+_CATEGORIES, _RULES, _WHYS, _EXAMPLES = zip(
+    # ── Naming conventions (3) ────────────────────────────────
+    (
+        "naming",
+        "Custom fields must use the x_ prefix",
+        (
+            "Odoo reserves unprefixed field names for core modules. "
+            "The x_ prefix marks fields as user-created and prevents "
+            "conflicts during module upgrades."
+        ),
+        "x_loyalty_tier, x_tax_exempt, x_delivery_window",
+    ),
+    (
+        "naming",
+        "Custom models must use the x_ prefix",
+        (
+            "Like fields, custom model technical names must start with "
+            "x_ to distinguish them from core models and avoid upgrade "
+            "collisions."
+        ),
+        "x_quality_check, x_booking_slot, x_maintenance_log",
+    ),
+    (
+        "naming",
+        "Use snake_case for technical names and Title Case for user-facing labels",
+        (
+            "Odoo convention uses snake_case for technical names "
+            "(field names, model names) and Title Case for string labels "
+            "shown in the UI."
+        ),
+        "Field name: x_delivery_date, Label: 'Delivery Date'",
+    ),
+
+    # ── Model design (5) ─────────────────────────────────────
+    (
+        "model_design",
+        "Extend existing models before creating new ones",
+        (
+            "Adding fields to res.partner, product.template, or "
+            "sale.order is simpler and preserves existing workflows. "
+            "Only create new models when the data does not logically "
+            "belong on an existing model."
+        ),
+        (
+            "Add x_allergens to product.template instead of creating "
+            "a separate x_product_allergen model."
+        ),
+    ),
+    (
+        "model_design",
+        "Add mail.thread inheritance for records that need discussion and tracking",
+        (
+            "mail.thread provides the chatter (message log), email "
+            "integration, and field-change tracking that users expect "
+            "on business documents."
+        ),
+        "Custom model x_maintenance_request should inherit mail.thread.",
+    ),
+    (
+        "model_design",
+        "Include a _rec_name or name field on every model",
+        (
+            "Odoo uses _rec_name (defaults to 'name') for display in "
+            "dropdowns, breadcrumbs, and log messages. Without it, "
+            "records show as 'x_model,42' which is confusing."
+        ),
+        "Always add a Char field 'x_name' or set _rec_name to a meaningful field.",
+    ),
+    (
+        "model_design",
+        "Use Selection fields for fixed-choice states, Many2one for user-configurable stages",
+        (
+            "Selection fields are fast and simple for fixed workflows "
+            "(draft/confirmed/done). Many2one to a stage model is "
+            "better when users need to add/reorder stages."
+        ),
+        (
+            "state = Selection for invoice status; stage_id = Many2one "
+            "for CRM pipeline stages."
+        ),
+    ),
+    (
+        "model_design",
+        "Always define _description on custom models",
+        (
+            "The _description string appears in the UI (e.g., access "
+            "rights configuration, log entries). Without it, users "
+            "see the raw technical name."
+        ),
+        "_description = 'Maintenance Request'",
+    ),
+
+    # ── Fields (3) ───────────────────────────────────────────
+    (
+        "fields",
+        "Set required=True only when the field is truly mandatory for business logic",
+        (
+            "Over-requiring fields frustrates users and blocks imports. "
+            "Reserve required=True for fields the system cannot function without."
+        ),
+        "name is required, but x_notes should not be.",
+    ),
+    (
+        "fields",
+        "Use Monetary fields (not Float) for all currency amounts",
+        (
+            "Monetary fields automatically respect currency precision "
+            "and display the correct currency symbol. Float fields "
+            "can cause rounding errors in financial calculations."
+        ),
+        "x_budget_amount = fields.Monetary(currency_field='currency_id')",
+    ),
+    (
+        "fields",
+        "Define string labels and help tooltips on every custom field",
+        (
+            "Clear labels and help text make the UI self-documenting "
+            "and reduce support requests. The help text appears as "
+            "a tooltip on hover."
+        ),
+        "x_lead_time = Integer(string='Lead Time (Days)', help='Average days from order to delivery')",
+    ),
+
+    # ── Security (3) ─────────────────────────────────────────
+    (
+        "security",
+        "Create access rights (ir.model.access) for every custom model",
+        (
+            "Models without access rights are invisible to non-admin "
+            "users. Every model needs at least one ir.model.access "
+            "record per user group."
+        ),
+        (
+            "Grant read/write/create to the user group and "
+            "read/write/create/unlink to the manager group."
+        ),
+    ),
+    (
+        "security",
+        "Use record rules (ir.rule) to restrict data by company in multi-company setups",
+        (
+            "Without record rules, users in Company A can see and "
+            "modify Company B's data. Record rules enforce row-level "
+            "data isolation."
+        ),
+        "domain_force: ['|', ('company_id', '=', False), ('company_id', 'in', company_ids)]",
+    ),
+    (
+        "security",
+        "Never give admin/superuser access to regular business users",
+        (
+            "The admin account bypasses all security rules. Regular "
+            "users should be assigned to appropriate security groups "
+            "with the minimum necessary permissions."
+        ),
+        "Create dedicated groups like 'Sales / User' and 'Sales / Manager'.",
+    ),
+
+    # ── Views (3) ────────────────────────────────────────────
+    (
+        "views",
+        "Always create both form and tree (list) views for custom models",
+        (
+            "Tree views provide an overview for browsing records; "
+            "form views are needed for editing. Without both, the "
+            "user experience is incomplete."
+        ),
+        "Create ir.ui.view records with type='form' and type='tree'.",
+    ),
+    (
+        "views",
+        "Use view inheritance (inherit_id) to modify existing views instead of replacing them",
+        (
+            "Replacing a view loses all other customizations and "
+            "may break on upgrade. Inheritance uses XPath to surgically "
+            "add or modify specific elements."
+        ),
+        "inherit_id = 'sale.view_order_form', arch uses xpath to add fields.",
+    ),
+    (
+        "views",
+        "Group related fields using <group> and <notebook>/<page> elements",
+        (
+            "Organized forms are easier to use. Group related fields "
+            "together and use tabs (notebook pages) for secondary "
+            "information."
+        ),
+        (
+            "Main info in the first group, financial details in a "
+            "second group, notes in a separate tab."
+        ),
+    ),
+
+    # ── Automation (2) ───────────────────────────────────────
+    (
+        "automation",
+        "Prefer server actions and automated rules over custom Python code",
+        (
+            "Server actions and base.automation rules can be created "
+            "and modified through the UI without code deployment. "
+            "Use code only when the logic is too complex for declarative rules."
+        ),
+        (
+            "Use an automated action to send an email when stage changes, "
+            "instead of overriding the write method."
+        ),
+    ),
+    (
+        "automation",
+        "Set appropriate triggers and filters on automated actions to avoid performance issues",
+        (
+            "An automated action without a filter domain runs on every "
+            "record write, which can be very slow on large datasets. "
+            "Always include a filter to narrow the trigger scope."
+        ),
+        (
+            "Filter: [('stage_id.name', '=', 'Won')] instead of "
+            "triggering on every crm.lead write."
+        ),
+    ),
+
+    # ── Reports (1) ──────────────────────────────────────────
+    (
+        "reports",
+        "Use QWeb templates for PDF reports and inherit existing report templates when possible",
+        (
+            "QWeb is Odoo's native template engine for reports. "
+            "Inheriting existing templates (e.g., account.report_invoice) "
+            "preserves the standard layout while allowing targeted modifications."
+        ),
+        "Inherit 'account.report_invoice_document' to add a custom footer.",
+    ),
+
+    # ── Performance (2) ──────────────────────────────────────
+    (
+        "performance",
+        "Add database indexes to fields used frequently in search domains and filters",
+        (
+            "Fields used in domain filters, group-by operations, or "
+            "ORDER BY clauses benefit from indexing. Without indexes, "
+            "queries on large tables become slow."
+        ),
+        "Set index=True on frequently-searched fields like x_region or x_status.",
+    ),
+    (
+        "performance",
+        "Use read_group instead of search_read when you only need aggregate data",
+        (
+            "read_group performs aggregation at the database level "
+            "(SQL GROUP BY) which is far more efficient than fetching "
+            "all records and aggregating in Python."
+        ),
+        "rpc.read_group('sale.order', [], ['amount_total:sum'], ['state'])",
+    ),
+)
+
+
+# Categories repeat across rules; make every occurrence share one string.
+_CATEGORIES = tuple(map(sys.intern, _CATEGORIES))
+
+
+def _build_category_index(categories: tuple[str, ...]) -> dict[str, tuple[int, ...]]:
+    index: dict[str, list[int]] = {}
+    for i, category in enumerate(categories):
+        index.setdefault(category, []).append(i)
+    return {category: tuple(ids) for category, ids in index.items()}
+
+
+_CATEGORY_INDEX: dict[str, tuple[int, ...]] = _build_category_index(_CATEGORIES)
+
+
+def _rows(ids: tuple[int, ...]) -> tuple[dict[str, str], ...]:
+    if not ids:
+        return ()
+    pick = itemgetter(*ids)
+    columns = (pick(_CATEGORIES), pick(_RULES), pick(_WHYS), pick(_EXAMPLES))
+    if len(ids) == 1:
+        # itemgetter with a single index returns the item, not a 1-tuple.
+        columns = tuple((column,) for column in columns)
+    return tuple(dict(zip(_FIELDS, row)) for row in zip(*columns))
+
+
+class _BestPractices(Mapping[str, Any]):
+    """Read-only view over the rule columns.
+
+    Behaves as the old ``{"rules": ...}`` mapping (``BEST_PRACTICES["rules"]``,
+    ``.get()``, iteration, ``dict(...)``) by materializing that form once,
+    on first use.
+    """
+
+    __slots__ = ("_legacy",)
+
+    def __init__(self) -> None:
+        self._legacy: dict[str, Any] | None = None
+
+    def categories(self) -> tuple[str, ...]:
+        """Return the rule categories in declaration order."""
+        return tuple(_CATEGORY_INDEX)
+
+    def by_category(self, category: str) -> tuple[dict[str, str], ...]:
+        """Return the rules of one category (empty if unknown)."""
+        return _rows(_CATEGORY_INDEX.get(category, ()))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the legacy ``{"rules": (...)}`` structure."""
+        if self._legacy is None:
+            self._legacy = {"rules": _rows(tuple(range(len(_RULES))))}
+        return self._legacy
+
+    def __getitem__(self, key: str) -> Any:
+        return self.as_dict()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.as_dict())
+
+    def __len__(self) -> int:
+        return len(self.as_dict())
+
+
+BEST_PRACTICES = _BestPractices()
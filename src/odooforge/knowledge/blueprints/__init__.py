@@ -1,27 +1,181 @@
-"""Industry blueprint registry — aggregates all blueprint modules."""
+"""Industry blueprint registry — aggregates all blueprint modules.
+
+Blueprint modules are large dict literals, so each one is imported only
+the first time its blueprint is looked up.
+"""
 
 from __future__ import annotations
 
+import importlib
+import sys
+from collections.abc import Iterator, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from odooforge.knowledge.blueprints.bakery import BAKERY_BLUEPRINT
-from odooforge.knowledge.blueprints.restaurant import RESTAURANT_BLUEPRINT
-from odooforge.knowledge.blueprints.ecommerce import ECOMMERCE_BLUEPRINT
-from odooforge.knowledge.blueprints.manufacturing import MANUFACTURING_BLUEPRINT
-from odooforge.knowledge.blueprints.services import SERVICES_BLUEPRINT
-from odooforge.knowledge.blueprints.retail import RETAIL_BLUEPRINT
-from odooforge.knowledge.blueprints.healthcare import HEALTHCARE_BLUEPRINT
-from odooforge.knowledge.blueprints.education import EDUCATION_BLUEPRINT
-from odooforge.knowledge.blueprints.real_estate import REAL_ESTATE_BLUEPRINT
-
-BLUEPRINTS: dict[str, dict[str, Any]] = {
-    "bakery": BAKERY_BLUEPRINT,
-    "restaurant": RESTAURANT_BLUEPRINT,
-    "ecommerce": ECOMMERCE_BLUEPRINT,
-    "manufacturing": MANUFACTURING_BLUEPRINT,
-    "services": SERVICES_BLUEPRINT,
-    "retail": RETAIL_BLUEPRINT,
-    "healthcare": HEALTHCARE_BLUEPRINT,
-    "education": EDUCATION_BLUEPRINT,
-    "real_estate": REAL_ESTATE_BLUEPRINT,
+# blueprint id -> "module:ATTRIBUTE"
+_BLUEPRINT_MODULES: dict[str, str] = {
+    "bakery": "odooforge.knowledge.blueprints.bakery:BAKERY_BLUEPRINT",
+    "restaurant": "odooforge.knowledge.blueprints.restaurant:RESTAURANT_BLUEPRINT",
+    "ecommerce": "odooforge.knowledge.blueprints.ecommerce:ECOMMERCE_BLUEPRINT",
+    "manufacturing": "odooforge.knowledge.blueprints.manufacturing:MANUFACTURING_BLUEPRINT",
+    "services": "odooforge.knowledge.blueprints.services:SERVICES_BLUEPRINT",
+    "retail": "odooforge.knowledge.blueprints.retail:RETAIL_BLUEPRINT",
+    "healthcare": "odooforge.knowledge.blueprints.healthcare:HEALTHCARE_BLUEPRINT",
+    "education": "odooforge.knowledge.blueprints.education:EDUCATION_BLUEPRINT",
+    "real_estate": "odooforge.knowledge.blueprints.real_estate:REAL_ESTATE_BLUEPRINT",
 }
+
+
+# Keys whose string values are module or model names worth interning.
+_NAME_KEYS = frozenset({"module", "model"})
+
+# id(source dict) -> its frozen copy, so a literal shared by several
+# blueprints (see ``_catalog``) is still one object once frozen.  The
+# sources are module globals, so their ids stay valid.
+_FROZEN: dict[int, Mapping[str, Any]] = {}
+
+
+def _freeze_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        frozen = _FROZEN.get(id(value))
+        if frozen is None:
+            frozen = _FROZEN[id(value)] = MappingProxyType({
+                key: sys.intern(item) if key in _NAME_KEYS and isinstance(item, str)
+                else _freeze_value(item)
+                for key, item in value.items()
+            })
+        return frozen
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_value(item) for item in value)
+    return value
+
+
+def _freeze(blueprint: dict[str, Any]) -> Mapping[str, Any]:
+    """Return a deeply read-only copy of *blueprint* with interned names.
+
+    Every nested dict becomes a ``MappingProxyType`` and every list a
+    tuple, so no caller can change the shared blueprint at any level.  The
+    source literals are left untouched.  The same module and model names
+    recur across blueprints (and dotted model names are not interned by the
+    compiler), so each is stored once.
+    """
+    frozen = {key: _freeze_value(item) for key, item in blueprint.items()}
+    frozen["modules"] = tuple(map(sys.intern, frozen.get("modules", ())))
+    frozen.setdefault("optional_modules", ())
+    return MappingProxyType(frozen)
+
+
+def thaw(value: Any) -> Any:
+    """Return a plain ``dict``/``list`` copy of frozen blueprint data.
+
+    For output that needs real containers, such as ``json.dumps`` or tool
+    results.
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class _LazyBlueprints(Mapping[str, Mapping[str, Any]]):
+    """Read-only mapping that imports a blueprint module on first lookup."""
+
+    def __init__(self, targets: dict[str, str]) -> None:
+        self._targets = targets
+        self._loaded: dict[str, Mapping[str, Any]] = {}
+
+    def __getitem__(self, blueprint_id: str) -> Mapping[str, Any]:
+        try:
+            return self._loaded[blueprint_id]
+        except KeyError:
+            pass
+        module_name, _, attr = self._targets[blueprint_id].partition(":")
+        blueprint = _freeze(getattr(importlib.import_module(module_name), attr))
+        self._loaded[blueprint_id] = blueprint
+        return blueprint
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._targets)
+
+    def __len__(self) -> int:
+        return len(self._targets)
+
+    def __contains__(self, blueprint_id: object) -> bool:
+        return blueprint_id in self._targets
+
+
+BLUEPRINTS: Mapping[str, Mapping[str, Any]] = _LazyBlueprints(_BLUEPRINT_MODULES)
+
+
+@lru_cache(maxsize=1)
+def module_index() -> Mapping[str, frozenset[str]]:
+    """Return ``module name -> ids of blueprints using it`` (built once).
+
+    Covers both required and optional modules.  Building it loads every
+    blueprint, so it is only done on first call.
+    """
+    index: dict[str, set[str]] = {}
+    for blueprint_id, bp in BLUEPRINTS.items():
+        names = [*bp["modules"], *(o["module"] for o in bp["optional_modules"])]
+        for name in names:
+            index.setdefault(name, set()).add(blueprint_id)
+    return MappingProxyType({name: frozenset(ids) for name, ids in index.items()})
+
+
+@lru_cache(maxsize=None)
+def _category_parents(blueprint_id: str) -> Mapping[str, str | None]:
+    categories = BLUEPRINTS[blueprint_id].get("sample_data", {}).get("product_categories", ())
+    return MappingProxyType({c["name"]: c["parent"] for c in categories})
+
+
+def category_ancestors(blueprint_id: str, name: str) -> Iterator[str]:
+    """Yield sample product category *name*, then each parent up to the root.
+
+    Parents are resolved through a ``name -> parent`` table built once per
+    blueprint.  Raises ``KeyError`` for an unknown category.
+    """
+    parents = _category_parents(blueprint_id)
+    current: str | None = name
+    while current is not None:
+        parent = parents[current]
+        yield current
+        current = parent
+
+
+@lru_cache(maxsize=None)
+def _sample_products(blueprint_id: str) -> Mapping[str, Mapping[str, Any]]:
+    products = BLUEPRINTS[blueprint_id].get("sample_data", {}).get("products", ())
+    return MappingProxyType({p["name"]: p for p in products})
+
+
+def sample_product(blueprint_id: str, name: str) -> Mapping[str, Any] | None:
+    """Return the sample product called *name* (e.g. a BoM component), or None.
+
+    Looked up through a ``name -> product`` table built once per blueprint;
+    BoM components may name raw materials that have no sample product.
+    """
+    return _sample_products(blueprint_id).get(name)
+
+
+# ATTRIBUTE -> blueprint id, for ``from ...blueprints import BAKERY_BLUEPRINT``
+_LAZY_ATTRS: dict[str, str] = {
+    target.partition(":")[2]: blueprint_id
+    for blueprint_id, target in _BLUEPRINT_MODULES.items()
+}
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: resolve *_BLUEPRINT names through the lazy registry, then
+    # cache them as real module globals.
+    try:
+        blueprint_id = _LAZY_ATTRS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = globals()[name] = BLUEPRINTS[blueprint_id]
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
@@ -0,0 +1,21 @@
+"""Optional-module entries shared by several blueprints.
+
+Blueprints reference these objects instead of repeating the literal, so
+each entry exists once however many blueprints suggest it.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+OPT_HR: dict[str, Any] = {"module": "hr", "when": "employee management"}
+OPT_HR_ATTENDANCE: dict[str, Any] = {
+    "module": "hr_attendance",
+    "when": "staff attendance tracking",
+}
+OPT_HR_HOLIDAYS: dict[str, Any] = {"module": "hr_holidays", "when": "staff leave management"}
+OPT_LOYALTY: dict[str, Any] = {"module": "loyalty", "when": "customer loyalty programme"}
+OPT_WEBSITE_SALE_STOCK: dict[str, Any] = {
+    "module": "website_sale_stock",
+    "when": "show stock availability online",
+}
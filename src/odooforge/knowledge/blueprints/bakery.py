@@ -4,6 +4,11 @@ from __future__ import annotations
 
 from typing import Any
 
+from odooforge.knowledge.blueprints._catalog import OPT_WEBSITE_SALE_STOCK
+
+# Selection values, kept as constant tuples rather than rebuilt lists.
+_LOYALTY_TIERS = (("bronze", "Bronze"), ("silver", "Silver"), ("gold", "Gold"))
+
 BAKERY_BLUEPRINT: dict[str, Any] = {
     "name": "Bakery / Artisan Food Producer",
     "description": (
@@ -29,7 +34,7 @@ BAKERY_BLUEPRINT: dict[str, Any] = {
     ],
     "optional_modules": [
         {"module": "website_sale", "when": "online ordering / delivery"},
-        {"module": "website_sale_stock", "when": "show stock availability online"},
+        OPT_WEBSITE_SALE_STOCK,
         {"module": "delivery", "when": "delivery service"},
         {"module": "quality_control", "when": "formal quality checks required"},
         {"module": "mrp_workorder", "when": "detailed work-center routing"},
@@ -45,7 +50,7 @@ BAKERY_BLUEPRINT: dict[str, Any] = {
                 {
                     "name": "x_loyalty_tier",
                     "type": "Selection",
-                    "selection": [("bronze", "Bronze"), ("silver", "Silver"), ("gold", "Gold")],
+                    "selection": _LOYALTY_TIERS,
                     "string": "Loyalty Tier",
                 },
                 {"name": "x_loyalty_points", "type": "Integer", "string": "Loyalty Points"},
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from odooforge.knowledge.blueprints._catalog import OPT_LOYALTY
+
 ECOMMERCE_BLUEPRINT: dict[str, Any] = {
     "name": "eCommerce Store",
     "description": (
@@ -23,7 +25,7 @@ ECOMMERCE_BLUEPRINT: dict[str, Any] = {
         "crm",
     ],
     "optional_modules": [
-        {"module": "loyalty", "when": "customer loyalty programme"},
+        OPT_LOYALTY,
         {"module": "sale_crm", "when": "link sales to CRM pipeline"},
         {"module": "website_blog", "when": "content marketing blog"},
         {"module": "website_livechat", "when": "live chat support"},
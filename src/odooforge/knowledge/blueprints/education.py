@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from odooforge.knowledge.blueprints._catalog import OPT_HR_ATTENDANCE, OPT_HR_HOLIDAYS
+
 EDUCATION_BLUEPRINT: dict[str, Any] = {
     "name": "Education / Training Center",
     "description": (
@@ -23,8 +25,8 @@ EDUCATION_BLUEPRINT: dict[str, Any] = {
     "optional_modules": [
         {"module": "website", "when": "school or training centre website"},
         {"module": "website_sale", "when": "online course enrollment"},
-        {"module": "hr_holidays", "when": "staff leave management"},
-        {"module": "hr_attendance", "when": "staff attendance tracking"},
+        OPT_HR_HOLIDAYS,
+        OPT_HR_ATTENDANCE,
         {"module": "hr_expense", "when": "expense tracking for trainers"},
     ],
     "models": [],
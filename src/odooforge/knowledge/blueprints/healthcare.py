@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from odooforge.knowledge.blueprints._catalog import OPT_HR_ATTENDANCE, OPT_HR_HOLIDAYS
+
 HEALTHCARE_BLUEPRINT: dict[str, Any] = {
     "name": "Healthcare / Medical Practice",
     "description": (
@@ -22,10 +24,10 @@ HEALTHCARE_BLUEPRINT: dict[str, Any] = {
         "project",
     ],
     "optional_modules": [
-        {"module": "hr_holidays", "when": "staff leave management"},
+        OPT_HR_HOLIDAYS,
         {"module": "hr_expense", "when": "expense tracking for practitioners"},
         {"module": "website", "when": "patient portal or clinic website"},
-        {"module": "hr_attendance", "when": "staff attendance tracking"},
+        OPT_HR_ATTENDANCE,
     ],
     "models": [],
     "automations": [],
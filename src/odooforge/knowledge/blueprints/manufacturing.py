@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from odooforge.knowledge.blueprints._catalog import OPT_HR
+
 MANUFACTURING_BLUEPRINT: dict[str, Any] = {
     "name": "Manufacturing / Production",
     "description": (
@@ -22,7 +24,7 @@ MANUFACTURING_BLUEPRINT: dict[str, Any] = {
         "contacts",
     ],
     "optional_modules": [
-        {"module": "hr", "when": "employee management"},
+        OPT_HR,
         {"module": "hr_attendance", "when": "shop floor attendance tracking"},
         {"module": "stock_account", "when": "inventory valuation in accounting"},
         {"module": "delivery", "when": "shipping finished goods"},
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from odooforge.knowledge.blueprints._catalog import OPT_HR_HOLIDAYS, OPT_LOYALTY
+
 RESTAURANT_BLUEPRINT: dict[str, Any] = {
     "name": "Restaurant / Food Service",
     "description": (
@@ -22,8 +24,8 @@ RESTAURANT_BLUEPRINT: dict[str, Any] = {
     ],
     "optional_modules": [
         {"module": "website", "when": "online presence or reservations"},
-        {"module": "loyalty", "when": "customer loyalty programme"},
-        {"module": "hr_holidays", "when": "staff leave management"},
+        OPT_LOYALTY,
+        OPT_HR_HOLIDAYS,
         {"module": "quality_control", "when": "food safety checks"},
     ],
     "models": [],
@@ -4,6 +4,12 @@ from __future__ import annotations
 
 from typing import Any
 
+from odooforge.knowledge.blueprints._catalog import (
+    OPT_HR,
+    OPT_HR_ATTENDANCE,
+    OPT_WEBSITE_SALE_STOCK,
+)
+
 RETAIL_BLUEPRINT: dict[str, Any] = {
     "name": "Retail Store",
     "description": (
@@ -21,10 +27,10 @@ RETAIL_BLUEPRINT: dict[str, Any] = {
     ],
     "optional_modules": [
         {"module": "website_sale", "when": "online store"},
-        {"module": "website_sale_stock", "when": "show stock availability online"},
+        OPT_WEBSITE_SALE_STOCK,
         {"module": "delivery", "when": "shipping / delivery service"},
-        {"module": "hr", "when": "employee management"},
-        {"module": "hr_attendance", "when": "staff attendance tracking"},
+        OPT_HR,
+        OPT_HR_ATTENDANCE,
     ],
     "models": [],
     "automations": [],
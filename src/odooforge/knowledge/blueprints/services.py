@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from odooforge.knowledge.blueprints._catalog import OPT_HR_HOLIDAYS
+
 SERVICES_BLUEPRINT: dict[str, Any] = {
     "name": "Professional Services / Consulting",
     "description": (
@@ -24,7 +26,7 @@ SERVICES_BLUEPRINT: dict[str, Any] = {
         "mail",
     ],
     "optional_modules": [
-        {"module": "hr_holidays", "when": "staff leave management"},
+        OPT_HR_HOLIDAYS,
         {"module": "hr_recruitment", "when": "hiring new consultants"},
         {"module": "website", "when": "company website or client portal"},
         {"module": "sale_crm", "when": "link quotations to CRM pipeline"},
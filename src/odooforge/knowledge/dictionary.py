@@ -7,8 +7,13 @@ right technical calls.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+from odooforge.knowledge._index import index_by
+
 DICTIONARY: dict[str, dict[str, Any]] = {
     # ── People & Contacts ─────────────────────────────────────────
     "customer": {
@@ -493,3 +498,52 @@ DICTIONARY: dict[str, dict[str, Any]] = {
         "module": "website",
     },
 }
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _canonicalize() -> None:
+    """Intern model/module names and freeze filters into shared tuples.
+
+    Names then compare by identity with the (also interned) blueprint and
+    module catalogs.  Filters become hashable tuple domains, and equal ones
+    (e.g. ``vendor``/``supplier``) are a single object.
+    """
+    filters: dict[tuple[Any, ...], tuple[Any, ...]] = {}
+    for entry in DICTIONARY.values():
+        entry["model"] = sys.intern(entry["model"])
+        if "module" in entry:
+            entry["module"] = sys.intern(entry["module"])
+        domain = _freeze(entry["filter"])
+        entry["filter"] = filters.setdefault(domain, domain)
+
+
+_canonicalize()
+
+
+# Reverse lookups, built once: "which terms map to res.partner / website?"
+DICTIONARY_BY_MODEL: dict[str, tuple[str, ...]] = index_by(DICTIONARY, "model")
+DICTIONARY_BY_MODULE: dict[str, tuple[str, ...]] = index_by(DICTIONARY, "module")
+
+
+def _normalize_term(term: str) -> str:
+    return " ".join(term.casefold().split())
+
+
+# Case- and spacing-insensitive view, keyed once at import.
+DICTIONARY_CI: dict[str, dict[str, Any]] = {
+    sys.intern(_normalize_term(term)): entry for term, entry in DICTIONARY.items()
+}
+
+
+def lookup(term: str) -> dict[str, Any] | None:
+    """Return the entry for *term*, ignoring case and extra whitespace."""
+    return DICTIONARY_CI.get(_normalize_term(term))
+
+
+# Read-only from here on; entries and indexes are shared by every caller.
+DICTIONARY: Mapping[str, dict[str, Any]] = MappingProxyType(DICTIONARY)  # type: ignore[no-redef]
@@ -2,8 +2,15 @@
 
 from __future__ import annotations
 
+import sys
+from array import array
+from collections import deque
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
+from odooforge.knowledge._index import index_by
+
 # ── Module Knowledge Catalog ──────────────────────────────────────
 #
 # Each entry maps a technical module name to structured metadata that
@@ -600,3 +607,186 @@ MODULES: dict[str, dict[str, Any]] = {
         ],
     },
 }
+
+
+def _compact() -> None:
+    """Freeze list fields into tuples and intern repeated names."""
+    for meta in MODULES.values():
+        meta["category"] = sys.intern(meta["category"])
+        meta["depends"] = tuple(map(sys.intern, meta["depends"]))
+        meta["business_needs"] = tuple(map(sys.intern, meta["business_needs"]))
+
+
+_compact()
+
+
+def _build_dependents() -> dict[str, tuple[str, ...]]:
+    dependents: dict[str, list[str]] = {name: [] for name in MODULES}
+    for name, meta in MODULES.items():
+        for dep in meta["depends"]:
+            dependents.setdefault(dep, []).append(name)
+    return {name: tuple(users) for name, users in dependents.items()}
+
+
+# Reverse of ``depends``: module -> catalog modules that depend on it
+# directly.  Built once so "what depends on X" is a single lookup.
+DEPENDENTS: dict[str, tuple[str, ...]] = _build_dependents()
+
+
+def _build_csr() -> tuple[tuple[str, ...], dict[str, int], array, array]:
+    nodes = list(MODULES)
+    node_idx = {name: i for i, name in enumerate(nodes)}
+    # Dependencies outside the catalog still get an id so every edge resolves.
+    for meta in MODULES.values():
+        for dep in meta["depends"]:
+            if dep not in node_idx:
+                node_idx[dep] = len(nodes)
+                nodes.append(dep)
+    indptr = array("i", [0])
+    indices = array("i")
+    for name in nodes:
+        meta = MODULES.get(name)
+        if meta is not None:
+            indices.extend(node_idx[dep] for dep in meta["depends"])
+        indptr.append(len(indices))
+    return tuple(nodes), node_idx, indptr, indices
+
+
+# Compressed-sparse-row view of the dependency graph.  Node ``i`` depends
+# on ``_INDICES[_INDPTR[i]:_INDPTR[i + 1]]``; traversals walk these flat
+# int arrays instead of the per-module tuples of names.
+_NODES, _NODE_IDX, _INDPTR, _INDICES = _build_csr()
+
+
+def neighbors(name: str) -> array:
+    """Return the integer ids of the direct dependencies of *name*.
+
+    Ids index into the catalog in insertion order; raises ``KeyError`` for
+    an unknown module.
+    """
+    i = _NODE_IDX[name]
+    return _INDICES[_INDPTR[i]:_INDPTR[i + 1]]
+
+
+def _find_cycle(indptr: array, indices: array) -> list[int] | None:
+    """Return the node ids of one dependency cycle in a CSR graph, or None.
+
+    Iterative Tarjan SCC with explicit stacks, so deep chains cannot hit
+    the recursion limit.  Any strongly connected component with more than
+    one node, or a node that depends on itself, is a cycle.
+    """
+    n = len(indptr) - 1
+    index = [-1] * n
+    low = [0] * n
+    on_stack = [False] * n
+    stack: list[int] = []
+    counter = 0
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, indptr[root])]
+        while work:
+            v, pos = work[-1]
+            if pos < indptr[v + 1]:
+                work[-1] = (v, pos + 1)
+                w = indices[pos]
+                if w == v:
+                    return [v]
+                if index[w] == -1:
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, indptr[w]))
+                elif on_stack[w]:
+                    low[v] = min(low[v], index[w])
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[v])
+            if low[v] == index[v]:
+                component = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    component.append(w)
+                    if w == v:
+                        break
+                if len(component) > 1:
+                    return component[::-1]
+    return None
+
+
+def _check_acyclic() -> None:
+    cycle = _find_cycle(_INDPTR, _INDICES)
+    if cycle is not None:
+        names = ", ".join(_NODES[i] for i in cycle)
+        raise ValueError(f"Module dependency cycle between: {names}")
+
+
+# A cycle would leave TOPO_ORDER incomplete, so refuse to load at all.
+_check_acyclic()
+
+
+def _build_topo_order() -> tuple[tuple[str, ...], dict[str, int]]:
+    """Kahn's algorithm over the CSR arrays: dependencies come first."""
+    n = len(_NODES)
+    indeg = [_INDPTR[i + 1] - _INDPTR[i] for i in range(n)]
+    users: list[list[int]] = [[] for _ in range(n)]
+    for i in range(n):
+        for dep in _INDICES[_INDPTR[i]:_INDPTR[i + 1]]:
+            users[dep].append(i)
+    level = [0] * n
+    queue = deque(i for i in range(n) if not indeg[i])
+    order: list[int] = []
+    while queue:
+        i = queue.popleft()
+        order.append(i)
+        for user in users[i]:
+            level[user] = max(level[user], level[i] + 1)
+            indeg[user] -= 1
+            if not indeg[user]:
+                queue.append(user)
+    return tuple(_NODES[i] for i in order), {_NODES[i]: level[i] for i in order}
+
+
+# Install order (every module after all of its dependencies) and each
+# module's depth in the graph: 0 for modules with no dependencies, else
+# one more than the deepest dependency.
+TOPO_ORDER, LEVEL = _build_topo_order()
+
+
+def _build_closure() -> dict[str, frozenset[str]]:
+    closure: dict[str, frozenset[str]] = {}
+    # TOPO_ORDER guarantees every dependency's closure is already known.
+    for name in TOPO_ORDER:
+        depends = MODULES[name]["depends"] if name in MODULES else ()
+        closure[name] = frozenset(depends).union(*(closure[d] for d in depends))
+    return closure
+
+
+# Every module's full set of direct and indirect dependencies.
+CLOSURE: dict[str, frozenset[str]] = _build_closure()
+
+
+# Inverted indexes, built once: "which modules are 'sales' / cover
+# 'invoicing'?"
+BY_CATEGORY: dict[str, tuple[str, ...]] = index_by(MODULES, "category")
+BY_BUSINESS_NEED: dict[str, tuple[str, ...]] = index_by(MODULES, "business_needs")
+
+
+# Direct dependencies as sets, for membership tests and set algebra.  The
+# ``depends`` tuples keep their declared order for display and JSON.
+DEPENDS_SET: dict[str, frozenset[str]] = {
+    name: frozenset(meta["depends"]) for name, meta in MODULES.items()
+}
+
+
+# No module can be added, removed or replaced once the graph tables above
+# are derived from it; the list fields were already frozen by _compact().
+MODULES: Mapping[str, dict[str, Any]] = MappingProxyType(MODULES)  # type: ignore[no-redef]
@@ -2,6 +2,7 @@
 from __future__ import annotations
 from typing import Any
 from odooforge.knowledge import get_knowledge_base
+from odooforge.knowledge.blueprints import thaw
 
 
 def design_solution(
@@ -126,7 +127,7 @@ def _build_foundation_phase(requirements: dict, kb) -> list[dict]:
         if bp and bp.get("settings"):
             steps.append({
                 "tool": "odoo_settings_set",
-                "params": {"settings": bp["settings"]},
+                "params": {"settings": thaw(bp["settings"])},
                 "description": f"Apply {blueprint_id} configuration settings",
             })
 
@@ -46,8 +46,6 @@ async def app_lifespan(server: FastMCP):
         password=cfg.odoo_admin_password,
     )
 
-    docker = OdooDocker(compose_path=cfg.docker_compose_path)
-
     pg = OdooPG(
         host=cfg.postgres_host,
         port=cfg.postgres_port,
@@ -55,6 +53,8 @@ async def app_lifespan(server: FastMCP):
         password=cfg.postgres_password,
     )
 
+    docker = OdooDocker(compose_path=cfg.docker_compose_path, pg=pg)
+
     cache = LiveStateCache(rpc)
 
     state = AppState(rpc=rpc, docker=docker, pg=pg, cache=cache, config=cfg)
@@ -72,6 +72,7 @@ async def app_lifespan(server: FastMCP):
         yield state
     finally:
         await pg.close()
+        await rpc.aclose()
 
 
 # ── MCP Server ─────────────────────────────────────────────────────
@@ -103,7 +104,7 @@ def _state(ctx) -> AppState:
 )
 def knowledge_modules() -> str:
     from odooforge.knowledge import get_knowledge_base
-    return json.dumps(get_knowledge_base().get_modules(), indent=2)
+    return json.dumps(dict(get_knowledge_base().get_modules()), indent=2)
 
 
 @mcp.resource(
@@ -114,7 +115,7 @@ def knowledge_modules() -> str:
 )
 def knowledge_dictionary() -> str:
     from odooforge.knowledge import get_knowledge_base
-    return json.dumps(get_knowledge_base().get_dictionary(), indent=2)
+    return json.dumps(dict(get_knowledge_base().get_dictionary()), indent=2)
 
 
 @mcp.resource(
@@ -164,12 +165,13 @@ def knowledge_blueprints_index() -> str:
 )
 def knowledge_blueprint(industry: str) -> str:
     from odooforge.knowledge import get_knowledge_base
+    from odooforge.knowledge.blueprints import thaw
     kb = get_knowledge_base()
     bp = kb.get_blueprint(industry)
     if bp is None:
         available = kb.list_blueprints()
         return json.dumps({"error": f"Unknown industry: {industry}", "available": available})
-    return json.dumps(bp, indent=2)
+    return json.dumps(thaw(bp), indent=2)
 
 
 # ── MCP Prompts (Workflow Templates) ─────────────────────────────
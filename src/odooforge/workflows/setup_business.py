@@ -19,6 +19,7 @@ def setup_business(
     sequentially.
     """
     from odooforge.knowledge import get_knowledge_base
+    from odooforge.knowledge.blueprints import thaw
 
     kb = get_knowledge_base()
     bp = kb.get_blueprint(blueprint_name)
@@ -60,7 +61,7 @@ def setup_business(
     steps.append({
         "step": step_num,
         "tool": "odoo_module_install",
-        "params": {"db_name": db_name, "module_names": bp.get("modules", [])},
+        "params": {"db_name": db_name, "module_names": list(bp.get("modules", ()))},
         "description": f"Install {len(bp.get('modules', []))} modules",
     })
     step_num += 1
@@ -70,7 +71,7 @@ def setup_business(
         steps.append({
             "step": step_num,
             "tool": "odoo_settings_set",
-            "params": {"db_name": db_name, **bp["settings"]},
+            "params": {"db_name": db_name, **thaw(bp["settings"])},
             "description": "Apply blueprint settings",
         })
         step_num += 1
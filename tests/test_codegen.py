@@ -233,6 +233,37 @@ class TestModelGen:
 
         assert _to_class_name("x_recipe.category") == "XRecipeCategory"
 
+    def test_one2many_includes_relation_and_inverse(self):
+        from odooforge.codegen.model_gen import generate_models
+
+        result = generate_models({
+            "name": "x_recipe",
+            "fields": [{
+                "name": "line_ids",
+                "type": "One2many",
+                "relation": "x_recipe.line",
+                "inverse_field": "recipe_id",
+            }],
+        })
+        assert "    line_ids = fields.One2many('x_recipe.line', 'recipe_id')" in result
+
+    def test_quotes_in_strings_produce_valid_python(self):
+        from odooforge.codegen.model_gen import generate_models
+
+        result = generate_models({
+            "name": "x_quote",
+            "description": 'The "best" recipe',
+            "fields": [{"name": "note", "type": "Char", "help": "it's \\ fine"}],
+        })
+        compile(result, "x_quote.py", "exec")
+        assert """_description = 'The "best" recipe'""" in result
+
+    def test_description_keeps_double_quotes_around_apostrophes(self):
+        from odooforge.codegen.model_gen import generate_models
+
+        result = generate_models({"name": "x_tip", "description": "Chef's tip"})
+        assert '_description = "Chef\'s tip"' in result
+
     def test_required_field_attribute(self):
         from odooforge.codegen.model_gen import generate_models
 
@@ -325,6 +356,21 @@ class TestViewGen:
         assert 'name="description"' in result
         assert 'name="prep_time"' in result
 
+    def test_special_characters_in_description_are_escaped(self):
+        from odooforge.codegen.view_gen import generate_views
+
+        model = {"name": "x_qa", "description": "Q&A <\"Tips\"> 'n' Tricks", "fields": []}
+        root = ET.fromstring(generate_views(model))
+        menu = root.find("menuitem")
+        assert menu.get("name") == "Q&A <\"Tips\"> 'n' Tricks"
+
+    def test_field_names_are_escaped(self):
+        from odooforge.codegen.view_gen import generate_views
+
+        model = {"name": "x_qa", "fields": [{"name": 'x_a"b', "type": "Char"}]}
+        root = ET.fromstring(generate_views(model))
+        assert 'x_a"b' in [f.get("name") for f in root.iter("field")]
+
 
 # ── TestSecurityGen ──────────────────────────────────────────────
 
@@ -360,6 +406,17 @@ class TestSecurityGen:
         manager_line = [l for l in lines if "manager" in l][0]
         assert manager_line.endswith("1,1,1,1")
 
+    def test_csv_quotes_values_containing_commas(self):
+        import csv
+        import io
+
+        from odooforge.codegen.security_gen import generate_access_csv
+
+        result = generate_access_csv([{"name": "x_odd,name", "fields": []}])
+        rows = list(csv.reader(io.StringIO(result)))
+        assert rows[1][1] == "x_odd,name.user"
+        assert len(rows[1]) == 8
+
     def test_security_xml_includes_groups(self):
         from odooforge.codegen.security_gen import generate_security_xml
 
@@ -495,6 +552,45 @@ class TestAddonBuilder:
         manifest = ast.literal_eval(result["files"]["__manifest__.py"])
         assert manifest["depends"] == ["base", "sale"]
 
+    def test_iter_addon_files_matches_build_addon(self):
+        from odooforge.codegen.addon_builder import build_addon, iter_addon_files
+
+        streamed = list(iter_addon_files("x_recipe", [SAMPLE_MODEL, SAMPLE_MODEL_SIMPLE]))
+        built = build_addon("x_recipe", [SAMPLE_MODEL, SAMPLE_MODEL_SIMPLE])
+        assert dict(streamed) == built["files"]
+        assert streamed[-1][0] == "__manifest__.py"
+
+    def test_write_addon_writes_module_tree(self, tmp_path):
+        from odooforge.codegen.addon_builder import build_addon, write_addon
+
+        result = write_addon(
+            tmp_path, "x_recipe", [SAMPLE_MODEL], security_groups=SAMPLE_SECURITY_GROUPS
+        )
+        built = build_addon("x_recipe", [SAMPLE_MODEL], security_groups=SAMPLE_SECURITY_GROUPS)
+
+        addon_dir = tmp_path / "x_recipe"
+        assert result["path"] == str(addon_dir)
+        assert result["summary"] == built["summary"]
+        for rel_path, content in built["files"].items():
+            assert (addon_dir / rel_path).read_text() == content
+
+
+# ── TestPackageExports ───────────────────────────────────────────
+
+
+class TestPackageExports:
+    def test_generators_resolve_from_package(self):
+        import odooforge.codegen as codegen
+        from odooforge.codegen.view_gen import generate_views
+
+        assert codegen.generate_views is generate_views
+
+    def test_unknown_attribute_raises(self):
+        import odooforge.codegen as codegen
+
+        with pytest.raises(AttributeError):
+            codegen.generate_nothing
+
 
 # ── TestCodegenToolWrapper ───────────────────────────────────────
 
@@ -41,3 +41,32 @@ class TestConfig:
         c2 = get_config()
         # After reset, a new instance is created (might be equal but not same object)
         assert c1 is not c2
+
+    def test_compose_path_env_override(self, monkeypatch):
+        monkeypatch.setenv("DOCKER_COMPOSE_PATH", "/opt/odoo/docker-compose.yml")
+        cfg = OdooForgeConfig.from_env()
+        assert cfg.docker_compose_path == "/opt/odoo/docker-compose.yml"
+
+    def test_bundled_compose_path_resolved_once(self, monkeypatch):
+        from odooforge.config import _resolve_compose_path
+
+        monkeypatch.delenv("DOCKER_COMPOSE_PATH", raising=False)
+        _resolve_compose_path.cache_clear()
+        first = OdooForgeConfig.from_env().docker_compose_path
+        second = OdooForgeConfig.from_env().docker_compose_path
+        assert first == second
+        assert _resolve_compose_path.cache_info().misses == 1
+
+    def test_snapshots_dir_next_to_compose_file(self, monkeypatch, tmp_path):
+        compose = tmp_path / "docker-compose.yml"
+        compose.write_text("services: {}\n")
+        monkeypatch.setenv("DOCKER_COMPOSE_PATH", str(compose))
+        monkeypatch.delenv("ODOOFORGE_SNAPSHOTS_DIR", raising=False)
+        cfg = OdooForgeConfig.from_env()
+        assert cfg.snapshots_dir == str(tmp_path / "snapshots")
+
+    def test_snapshots_dir_inside_compose_directory(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("DOCKER_COMPOSE_PATH", str(tmp_path))
+        monkeypatch.delenv("ODOOFORGE_SNAPSHOTS_DIR", raising=False)
+        cfg = OdooForgeConfig.from_env()
+        assert cfg.snapshots_dir == str(tmp_path / "snapshots")
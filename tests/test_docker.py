@@ -1,6 +1,8 @@
 """Tests for Docker client with mocked subprocess calls."""
 
+import asyncio
 import json
+import sys
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from pathlib import Path
@@ -21,6 +23,43 @@ def docker(tmp_compose):
     return OdooDocker(str(tmp_compose))
 
 
+class TestRun:
+    @pytest.mark.asyncio
+    async def test_returns_output(self):
+        from odooforge.connections.docker_client import _run
+
+        rc, stdout, _ = await _run([sys.executable, "-c", "print('ok')"])
+        assert rc == 0
+        assert stdout.strip() == "ok"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process(self):
+        from odooforge.connections.docker_client import _run
+
+        with pytest.raises(TimeoutError, match="timed out"):
+            await _run([sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.2)
+
+    @pytest.mark.asyncio
+    async def test_streams_files(self, tmp_path):
+        from odooforge.connections.docker_client import _run
+
+        src, dst = tmp_path / "in.bin", tmp_path / "out.bin"
+        src.write_bytes(b"\x00dump\xff" * 1000)
+        copy = "import sys, shutil; shutil.copyfileobj(sys.stdin.buffer, sys.stdout.buffer)"
+        rc, stdout, _ = await _run([sys.executable, "-c", copy], stdin_path=src, stdout_path=dst)
+        assert rc == 0
+        assert stdout == ""
+        assert dst.read_bytes() == src.read_bytes()
+
+    @pytest.mark.asyncio
+    async def test_remaining_raises_after_deadline(self):
+        from odooforge.connections.docker_client import _deadline, _remaining
+
+        assert 0 < _remaining(_deadline(60)) <= 60
+        with pytest.raises(TimeoutError):
+            _remaining(_deadline(-1))
+
+
 class TestInit:
     def test_valid_path(self, tmp_compose):
         d = OdooDocker(str(tmp_compose))
@@ -94,23 +133,97 @@ class TestStatus:
             result = await docker.status()
             assert result["running"] is False
 
+    def test_parse_ps_output_formats(self):
+        from odooforge.connections.docker_client import _parse_ps_output
+
+        web = {"Name": "web", "State": "running"}
+        db = {"Name": "db", "State": "running"}
+        assert _parse_ps_output(json.dumps([web, db])) == [web, db]
+        assert _parse_ps_output(f"{json.dumps(web)}\n{json.dumps(db)}\n") == [web, db]
+        assert _parse_ps_output(f"{json.dumps(web)}\nnot json\n") == [web]
+        assert _parse_ps_output("  \n") == []
+
+    @pytest.mark.asyncio
+    async def test_status_reused_within_ttl(self, docker):
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "")
+            first = await docker.status()
+            second = await docker.status()
+            assert first == second
+            assert mock_run.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cached_status_is_not_shared(self, docker):
+        ps = json.dumps([{"Name": "web", "State": "running", "Publishers": [{"PublishedPort": 8069}]}])
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, ps, "")
+            first = await docker.status()
+            first["running"] = False
+            first["containers"][0]["Publishers"].clear()
+            second = await docker.status()
+        assert second["running"] is True
+        assert second["containers"][0]["Publishers"] == [{"PublishedPort": 8069}]
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_call_drops_status_cache(self, docker):
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "")
+            await docker.status()
+            await docker.restart_service("web")
+            await docker.status()
+            assert mock_run.call_count == 3
+
+
+def _fake_proc(stdout: bytes, stderr: bytes = b"", returncode: int = 0):
+    """A stand-in for an asyncio subprocess with pre-filled output streams."""
+    import asyncio
+
+    proc = MagicMock()
+    proc.stdout = asyncio.StreamReader()
+    proc.stdout.feed_data(stdout)
+    proc.stdout.feed_eof()
+    proc.stderr = asyncio.StreamReader()
+    proc.stderr.feed_data(stderr)
+    proc.stderr.feed_eof()
+    proc.returncode = returncode
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
 
 class TestLogs:
     @pytest.mark.asyncio
     async def test_logs(self, docker):
-        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = (0, "2024-01-01 INFO startup\n2024-01-01 ERROR oops\n", "")
+        proc = _fake_proc(b"2024-01-01 INFO startup\n2024-01-01 ERROR oops\n")
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as spawn:
             logs = await docker.logs(lines=50)
-            assert "startup" in logs
-            assert "oops" in logs
+            assert logs == "2024-01-01 INFO startup\n2024-01-01 ERROR oops\n"
+            assert "--tail=50" in spawn.call_args.args
 
     @pytest.mark.asyncio
     async def test_logs_with_grep(self, docker):
-        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
-            mock_run.return_value = (0, "INFO startup\nERROR oops\nINFO done\n", "")
+        proc = _fake_proc(b"INFO startup\nERROR oops\nINFO done\nerror again\n")
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
             logs = await docker.logs(grep="ERROR")
-            assert "oops" in logs
-            assert "startup" not in logs
+            assert logs == "ERROR oops\nerror again"
+
+    def test_grep_pattern_compiled_once(self):
+        from odooforge.connections.docker_client import _grep_pattern
+
+        pattern = _grep_pattern("err(or)?")
+        assert _grep_pattern("err(or)?") is pattern
+        assert pattern.search("FATAL ERROR")
+
+    @pytest.mark.asyncio
+    async def test_logs_grep_without_match_is_empty(self, docker):
+        proc = _fake_proc(b"INFO startup\n", stderr=b"ERROR elsewhere\n")
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+            assert await docker.logs(grep="ERROR") == ""
+
+    @pytest.mark.asyncio
+    async def test_logs_fall_back_to_stderr(self, docker):
+        proc = _fake_proc(b"", stderr=b"INFO a\nERROR b\n")
+        with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+            assert await docker.logs(grep="error") == "ERROR b"
 
 
 class TestSnapshots:
@@ -146,3 +259,212 @@ class TestSnapshots:
         result = await docker.list_snapshots(db="db1")
         assert len(result) == 1
         assert result[0]["name"] == "s1"
+
+    @pytest.mark.asyncio
+    async def test_create_streams_dump_and_writes_manifest(self, docker):
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "")
+            manifest = await docker.create_snapshot("testdb", "snap1", "before upgrade")
+
+        mock_run.assert_awaited_once()
+        assert mock_run.call_args.args[0][-5:] == ["pg_dump", "-U", "odoo", "-Fc", "testdb"]
+        assert mock_run.call_args.kwargs["stdout_path"] == docker._snapshots_dir / "snap1.dump"
+        assert manifest["size_bytes"] == 0
+        saved = json.loads((docker._snapshots_dir / "snap1.json").read_text())
+        assert saved["description"] == "before upgrade"
+
+    @pytest.mark.asyncio
+    async def test_create_failure_removes_partial_dump(self, docker):
+        docker._snapshots_dir.mkdir(parents=True, exist_ok=True)
+        partial = docker._snapshots_dir / "snap1.dump"
+        partial.write_bytes(b"partial")
+
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (1, "", "database does not exist")
+            with pytest.raises(DockerError, match="pg_dump"):
+                await docker.create_snapshot("nodb", "snap1")
+
+        assert not partial.exists()
+        assert not (docker._snapshots_dir / "snap1.json").exists()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [TimeoutError, asyncio.CancelledError])
+    async def test_create_interrupted_removes_partial_dump(self, docker, error):
+        docker._snapshots_dir.mkdir(parents=True, exist_ok=True)
+        partial = docker._snapshots_dir / "snap1.dump"
+
+        async def interrupted(*args, **kwargs):
+            partial.write_bytes(b"partial")
+            raise error
+
+        with patch("odooforge.connections.docker_client._run", side_effect=interrupted):
+            with pytest.raises(error):
+                await docker.create_snapshot("testdb", "snap1")
+
+        assert not partial.exists()
+        assert not (docker._snapshots_dir / "snap1.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_restore_pipes_dump_into_pg_restore(self, docker):
+        snap_dir = docker._snapshots_dir
+        snap_dir.mkdir(parents=True, exist_ok=True)
+        (snap_dir / "snap1.dump").write_bytes(b"dump")
+
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "")
+            result = await docker.restore_snapshot("testdb", "snap1")
+
+        calls = mock_run.call_args_list
+        assert len(calls) == 3
+        script = calls[0].args[0][-1]
+        steps = ["pg_terminate_backend", "dropdb", "createdb"]
+        positions = [script.index(step) for step in steps]
+        assert positions == sorted(positions)
+        assert "pg_restore" in calls[1].args[0]
+        assert calls[1].kwargs["stdin_path"] == snap_dir / "snap1.dump"
+        assert "restart" in calls[2].args[0]
+        assert result["status"] == "restored"
+
+    @pytest.mark.asyncio
+    async def test_restore_failure_raises(self, docker):
+        snap_dir = docker._snapshots_dir
+        snap_dir.mkdir(parents=True, exist_ok=True)
+        (snap_dir / "snap1.dump").write_bytes(b"dump")
+
+        async def fake_run(cmd, **kwargs):
+            return (1, "", "invalid dump") if "pg_restore" in cmd else (0, "", "")
+
+        with patch("odooforge.connections.docker_client._run", side_effect=fake_run):
+            with pytest.raises(DockerError, match="pg_restore"):
+                await docker.restore_snapshot("testdb", "snap1")
+
+
+class TestHealth:
+    @staticmethod
+    def _client(get):
+        client = MagicMock()
+        client.get = get
+        client.__aenter__ = AsyncMock(return_value=client)
+        client.__aexit__ = AsyncMock(return_value=None)
+        return client
+
+    @pytest.mark.asyncio
+    async def test_healthy_returns_true(self, docker):
+        client = self._client(AsyncMock(return_value=MagicMock(status_code=200)))
+        with patch("httpx.AsyncClient", return_value=client) as client_cls:
+            assert await docker.wait_for_healthy(timeout=5) is True
+        client_cls.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_deadline_raises_docker_error(self, docker):
+        import httpx
+
+        client = self._client(AsyncMock(side_effect=httpx.ConnectError("refused")))
+        with patch("httpx.AsyncClient", return_value=client):
+            with pytest.raises(DockerError, match="did not become healthy"):
+                await docker.wait_for_healthy(timeout=0.1)
+
+
+class TestModuleCli:
+    @pytest.mark.asyncio
+    async def test_install_error_names_modules(self, docker):
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (1, "", "boom")
+            with pytest.raises(DockerError, match=r"Module install failed for \[sale,crm\]"):
+                await docker.install_module_via_cli("testdb", ["sale", "crm"])
+
+    @pytest.mark.asyncio
+    async def test_batch_combines_install_and_upgrade(self, docker):
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "done")
+            await docker.batch_modules_via_cli("testdb", install=["sale", "crm"], upgrade=["base"])
+
+        mock_run.assert_awaited_once()
+        cmd = mock_run.call_args.args[0]
+        assert cmd[cmd.index("-i") + 1] == "sale,crm"
+        assert cmd[cmd.index("-u") + 1] == "base"
+        assert cmd[-1] == "--stop-after-init"
+
+    @pytest.mark.asyncio
+    async def test_batch_chunks_and_reports_failing_chunk(self, docker):
+        async def fake_run(cmd, **kwargs):
+            return (1, "", "boom") if "m3,m4" in cmd else (0, "", "ok")
+
+        with patch("odooforge.connections.docker_client._run", side_effect=fake_run) as mock_run:
+            with pytest.raises(DockerError, match=r"\[m3,m4\]"):
+                await docker.batch_modules_via_cli("testdb", install=["m1", "m2", "m3", "m4"], chunk=2)
+        assert mock_run.call_count == 2
+
+
+class TestRestoreWithPG:
+    @pytest.fixture
+    def snapshot(self, docker):
+        snap_dir = docker._snapshots_dir
+        snap_dir.mkdir(parents=True, exist_ok=True)
+        (snap_dir / "snap1.dump").write_bytes(b"dump")
+        return docker
+
+    @pytest.mark.asyncio
+    async def test_recreate_goes_through_pg(self, snapshot):
+        snapshot._pg = MagicMock()
+        snapshot._pg.recreate_database = AsyncMock()
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "")
+            await snapshot.restore_snapshot("testdb", "snap1")
+
+        snapshot._pg.recreate_database.assert_awaited_once_with("testdb")
+        cmds = [call.args[0] for call in mock_run.call_args_list]
+        assert len(cmds) == 2
+        assert "pg_restore" in cmds[0]
+        assert "restart" in cmds[1]
+
+    @pytest.mark.asyncio
+    async def test_pg_failure_falls_back_to_exec(self, snapshot):
+        snapshot._pg = MagicMock()
+        snapshot._pg.recreate_database = AsyncMock(side_effect=OSError("refused"))
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "")
+            await snapshot.restore_snapshot("testdb", "snap1")
+
+        cmds = [call.args[0] for call in mock_run.call_args_list]
+        assert len(cmds) == 3
+        assert "dropdb" in cmds[0][-1]
+
+    @pytest.mark.asyncio
+    async def test_pg_failure_is_logged(self, snapshot, caplog):
+        from odooforge.connections.pg_client import PGError
+
+        snapshot._pg = MagicMock()
+        snapshot._pg.recreate_database = AsyncMock(side_effect=PGError("Execute failed: denied"))
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "")
+            await snapshot.restore_snapshot("testdb", "snap1")
+
+        assert len(mock_run.call_args_list) == 3
+        assert "Execute failed: denied" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_pg_auth_failure_falls_back_to_exec(self, snapshot):
+        import asyncpg
+
+        from odooforge.connections.pg_client import OdooPG
+
+        snapshot._pg = OdooPG(password="wrong")
+        auth_error = asyncpg.InvalidPasswordError('password authentication failed for user "odoo"')
+        with patch("asyncpg.create_pool", new_callable=AsyncMock, side_effect=auth_error), \
+                patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = (0, "", "")
+            await snapshot.restore_snapshot("testdb", "snap1")
+
+        cmds = [call.args[0] for call in mock_run.call_args_list]
+        assert len(cmds) == 3
+        assert "dropdb" in cmds[0][-1]
+
+    @pytest.mark.asyncio
+    async def test_unexpected_pg_error_propagates(self, snapshot):
+        snapshot._pg = MagicMock()
+        snapshot._pg.recreate_database = AsyncMock(side_effect=TypeError("bug"))
+        with patch("odooforge.connections.docker_client._run", new_callable=AsyncMock) as mock_run:
+            with pytest.raises(TypeError, match="bug"):
+                await snapshot.restore_snapshot("testdb", "snap1")
+        mock_run.assert_not_awaited()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import sys
 from pathlib import Path
 from unittest.mock import patch
@@ -166,6 +168,49 @@ def test_cli_help_flag(capsys: pytest.CaptureFixture[str]) -> None:
     assert "Usage" in captured.out
 
 
+def test_cli_help_does_not_import_server() -> None:
+    """``odooforge -h`` must not pay for loading the MCP server."""
+    import subprocess
+
+    code = (
+        "import sys; sys.argv = ['odooforge', '-h']\n"
+        "from odooforge.cli import main; main()\n"
+        "assert 'odooforge.server' not in sys.modules\n"
+        "assert 'mcp' not in sys.modules\n"
+    )
+    proc = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    assert "Usage" in proc.stdout
+
+
+@pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX shell")
+def test_shell_launcher_help_matches_cli() -> None:
+    """scripts/odooforge.sh answers ``-h`` itself; its text must match the CLI's."""
+    import subprocess
+
+    from odooforge.cli import USAGE
+
+    script = Path(__file__).resolve().parents[1] / "scripts" / "odooforge.sh"
+    proc = subprocess.run(["sh", str(script), "-h"], capture_output=True, text=True)
+    assert proc.returncode == 0
+    assert proc.stdout == USAGE + "\n"
+
+
+def test_cmd_launcher_help_matches_cli() -> None:
+    """scripts/odooforge.cmd echoes the same help text as the CLI."""
+    from odooforge.cli import USAGE
+
+    script = Path(__file__).resolve().parents[1] / "scripts" / "odooforge.cmd"
+    # The batch file keeps CRLF line endings; splitlines() handles both.
+    body = script.read_bytes().decode().split(":usage", 1)[1]
+    lines = [
+        "" if line == "echo." else line[len("echo "):]
+        for line in body.splitlines()
+        if line.startswith("echo")
+    ]
+    assert "\n".join(lines) + "\n" == USAGE + "\n"
+
+
 # ── Return value ─────────────────────────────────────────────────
 
 
@@ -181,6 +226,11 @@ def test_run_init_returns_results(workspace: Path) -> None:
 def test_update_overwrites_template_files(workspace: Path) -> None:
     """``--update`` should overwrite all template files (not .env)."""
     run_init(workspace)
+    for path, status in run_init(workspace):
+        if not path.endswith((".env", ".keep", ".gitignore")):
+            Path(path).write_text("stale")
+    gi = workspace / ".gitignore"
+    gi.write_text(gi.read_text() + "stale_entry\n")
     results = run_init(workspace, update=True)
     status_map = {p: s for p, s in results}
 
@@ -269,3 +319,81 @@ def test_update_overwrites_agent_files(workspace: Path) -> None:
     status_map = {p: s for p, s in results}
     assert status_map[str(agent)] == "updated"
     assert "custom content" not in agent.read_text()
+
+
+# ── Planning ─────────────────────────────────────────────────────
+
+
+def test_creates_missing_target_directory(tmp_path: Path) -> None:
+    target = tmp_path / "new" / "workspace"
+    results = run_init(target)
+    assert {s for _, s in results} == {"created"}
+    assert (target / ".claude" / "skills" / "odoo-data" / "SKILL.md").exists()
+
+
+def test_update_gitignore_keeps_following_sections(workspace: Path) -> None:
+    (workspace / ".gitignore").write_text(
+        "# OdooForge\n.env\nold_entry\n\nbuild/\n"
+    )
+    run_init(workspace, update=True)
+    content = (workspace / ".gitignore").read_text()
+    assert "old_entry" not in content
+    assert content.endswith("docker/snapshots/\n\nbuild/\n")
+
+
+def test_rerun_makes_no_directories(workspace: Path) -> None:
+    run_init(workspace)
+    with patch("os.mkdir") as mkdir:
+        run_init(workspace)
+    mkdir.assert_not_called()
+
+
+@pytest.mark.parametrize("size", [0, 100, 200_000])
+def test_copy_file_copies_bytes(tmp_path: Path, size: int) -> None:
+    from odooforge.init import _copy_file
+
+    src = tmp_path / "src.bin"
+    src.write_bytes(bytes(range(256)) * (size // 256) + b"x" * (size % 256))
+    dst = tmp_path / "dst.bin"
+    dst.write_bytes(b"stale content that is longer than nothing")
+    _copy_file(src, dst)
+    assert dst.read_bytes() == src.read_bytes()
+
+
+def test_gitignore_marker_found_outside_tail(workspace: Path) -> None:
+    gi = workspace / ".gitignore"
+    gi.write_text("# OdooForge\n.env\n\n" + "".join(f"build{i}/\n" for i in range(2000)))
+    before = gi.read_text()
+    results = dict(run_init(workspace))
+    assert results[str(gi)] == "skipped"
+    assert gi.read_text() == before
+
+
+def test_gitignore_append_trims_trailing_blank_lines(workspace: Path) -> None:
+    gi = workspace / ".gitignore"
+    gi.write_text("node_modules/\n\n\n")
+    run_init(workspace)
+    assert gi.read_text().startswith("node_modules/\n\n# OdooForge\n")
+
+
+def test_update_leaves_unchanged_files_alone(workspace: Path) -> None:
+    run_init(workspace)
+    claude_md = workspace / "CLAUDE.md"
+    skill = workspace / ".claude" / "skills" / "odoo-debug" / "SKILL.md"
+    for path in (claude_md, skill):
+        os.utime(path, (0, 0))
+    results = dict(run_init(workspace, update=True))
+    for path in (claude_md, skill):
+        assert results[str(path)] == "unchanged"
+        assert path.stat().st_mtime == 0
+    assert results[str(workspace / ".gitignore")] == "unchanged"
+    assert "updated" not in results.values()
+
+
+def test_summary_reports_unchanged_files(workspace: Path, capsys) -> None:
+    run_init(workspace)
+    capsys.readouterr()
+    run_init(workspace, update=True)
+    out = capsys.readouterr().out
+    assert "Unchanged 16 file(s)" in out
+    assert "Updated" not in out
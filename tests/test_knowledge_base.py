@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 import pytest
 
 from odooforge.knowledge import KnowledgeBase
@@ -22,16 +24,32 @@ class TestKnowledgeBase:
         kb = KnowledgeBase()
         assert kb is not None
 
+    def test_getters_import_only_their_module(self) -> None:
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from odooforge.knowledge import KnowledgeBase\n"
+            "kb = KnowledgeBase()\n"
+            "subs = ('modules', 'dictionary', 'patterns', 'best_practices', 'blueprints')\n"
+            "loaded = lambda: {s for s in subs if 'odooforge.knowledge.' + s in sys.modules}\n"
+            "assert loaded() == set(), loaded()\n"
+            "kb.get_patterns()\n"
+            "assert loaded() == {'patterns'}, loaded()\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
     def test_has_modules(self) -> None:
         kb = KnowledgeBase()
         modules = kb.get_modules()
-        assert isinstance(modules, dict)
+        assert isinstance(modules, Mapping)
         assert len(modules) > 0
 
     def test_has_dictionary(self) -> None:
         kb = KnowledgeBase()
         dictionary = kb.get_dictionary()
-        assert isinstance(dictionary, dict)
+        assert isinstance(dictionary, Mapping)
         assert len(dictionary) > 0
 
     def test_has_patterns(self) -> None:
@@ -107,20 +125,121 @@ class TestModulesKnowledge:
         """Must have at least 30 modules (spec says 35+)."""
         assert len(MODULES) >= 30, f"Only {len(MODULES)} modules, need at least 30"
 
-    def test_depends_is_list(self) -> None:
-        """The depends field must always be a list."""
+    def test_depends_is_tuple(self) -> None:
+        """The depends field must always be a tuple."""
         for module_id, info in MODULES.items():
-            assert isinstance(info["depends"], list), (
-                f"Module '{module_id}' depends is not a list"
+            assert isinstance(info["depends"], tuple), (
+                f"Module '{module_id}' depends is not a tuple"
             )
 
-    def test_business_needs_is_list(self) -> None:
-        """The business_needs field must be a non-empty list."""
+    def test_business_needs_is_tuple(self) -> None:
+        """The business_needs field must be a non-empty tuple."""
         for module_id, info in MODULES.items():
             needs = info["business_needs"]
-            assert isinstance(needs, list), f"Module '{module_id}' business_needs is not a list"
+            assert isinstance(needs, tuple), f"Module '{module_id}' business_needs is not a tuple"
             assert len(needs) > 0, f"Module '{module_id}' has empty business_needs"
 
+    def test_business_needs_are_interned(self) -> None:
+        import sys
+
+        # Build an equal but distinct string so the check cannot pass trivially.
+        for info in MODULES.values():
+            for need in info["business_needs"]:
+                assert sys.intern("".join(need)) is need
+
+    def test_category_and_need_indexes(self) -> None:
+        """BY_CATEGORY and BY_BUSINESS_NEED agree with a full scan."""
+        from odooforge.knowledge.modules import BY_BUSINESS_NEED, BY_CATEGORY
+
+        for category, names in BY_CATEGORY.items():
+            assert names == tuple(m for m, i in MODULES.items() if i["category"] == category)
+        for need, names in BY_BUSINESS_NEED.items():
+            assert names == tuple(m for m, i in MODULES.items() if need in i["business_needs"])
+        assert sum(map(len, BY_CATEGORY.values())) == len(MODULES)
+        assert "sale" in BY_CATEGORY["sales"]
+
+    def test_depends_set_matches_depends(self) -> None:
+        from odooforge.knowledge.modules import DEPENDS_SET
+
+        assert DEPENDS_SET.keys() == MODULES.keys()
+        for module_id, info in MODULES.items():
+            assert DEPENDS_SET[module_id] == frozenset(info["depends"])
+
+    def test_modules_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            MODULES["new_module"] = {}  # type: ignore[index]
+
+    def test_dependents_index(self) -> None:
+        """DEPENDENTS is the exact reverse of every depends list."""
+        from odooforge.knowledge.modules import DEPENDENTS
+
+        for module_id in MODULES:
+            assert module_id in DEPENDENTS
+        pairs = {(dep, m) for m, info in MODULES.items() for dep in info["depends"]}
+        assert {(dep, m) for dep, users in DEPENDENTS.items() for m in users} == pairs
+        assert "sale" in DEPENDENTS["account"]
+
+    def test_csr_neighbors_match_depends(self) -> None:
+        """The CSR arrays encode exactly each module's depends, in order."""
+        from odooforge.knowledge.modules import _NODES, _NODE_IDX, neighbors
+
+        for module_id, info in MODULES.items():
+            assert _NODES[_NODE_IDX[module_id]] == module_id
+            assert tuple(_NODES[i] for i in neighbors(module_id)) == info["depends"]
+        with pytest.raises(KeyError):
+            neighbors("no_such_module")
+
+    @pytest.mark.parametrize(
+        ("edges", "cycle"),
+        [
+            ([[1], [2], []], None),
+            ([[1], [2], [0]], {0, 1, 2}),
+            ([[], [1]], {1}),
+            ([[1], [], [3], [2]], {2, 3}),
+        ],
+    )
+    def test_find_cycle(self, edges: list[list[int]], cycle: set[int] | None) -> None:
+        from array import array
+
+        from odooforge.knowledge.modules import _find_cycle
+
+        indptr = array("i", [0])
+        indices = array("i")
+        for targets in edges:
+            indices.extend(targets)
+            indptr.append(len(indices))
+        found = _find_cycle(indptr, indices)
+        assert (None if found is None else set(found)) == cycle
+
+    def test_catalog_is_acyclic(self) -> None:
+        from odooforge.knowledge.modules import _INDICES, _INDPTR, _find_cycle
+
+        assert _find_cycle(_INDPTR, _INDICES) is None
+
+    def test_topo_order_and_levels(self) -> None:
+        """TOPO_ORDER lists every module after its depends; LEVEL is its depth."""
+        from odooforge.knowledge.modules import LEVEL, TOPO_ORDER
+
+        assert set(TOPO_ORDER) == set(MODULES)
+        position = {name: i for i, name in enumerate(TOPO_ORDER)}
+        for module_id, info in MODULES.items():
+            for dep in info["depends"]:
+                assert position[dep] < position[module_id]
+            expected = 1 + max((LEVEL[d] for d in info["depends"]), default=-1)
+            assert LEVEL[module_id] == expected
+
+    def test_closure_is_transitive(self) -> None:
+        """CLOSURE holds the direct depends plus all of their closures."""
+        from odooforge.knowledge.modules import CLOSURE
+
+        for module_id, info in MODULES.items():
+            expected = set(info["depends"])
+            for dep in info["depends"]:
+                expected |= CLOSURE[dep]
+            assert CLOSURE[module_id] == expected
+            assert module_id not in CLOSURE[module_id]
+        assert {"account", "mail"} <= CLOSURE["sale"]
+
 
 # ── Dictionary knowledge ─────────────────────────────────────────
 
@@ -167,12 +286,38 @@ class TestDictionaryKnowledge:
             model = info["model"]
             assert "." in model, f"Term '{term}' model '{model}' does not look like an Odoo model"
 
-    def test_filter_is_list(self) -> None:
-        """The filter field must be a list."""
+    def test_filter_is_tuple(self) -> None:
+        """The filter field must be a (hashable) tuple domain."""
         for term, info in DICTIONARY.items():
-            assert isinstance(info["filter"], list), (
-                f"Term '{term}' filter is not a list"
+            assert isinstance(info["filter"], tuple), (
+                f"Term '{term}' filter is not a tuple"
             )
+            hash(info["filter"])
+
+    def test_equal_filters_are_shared(self) -> None:
+        assert DICTIONARY["vendor"]["filter"] is DICTIONARY["supplier"]["filter"]
+
+    def test_lookup_ignores_case_and_spacing(self) -> None:
+        from odooforge.knowledge.dictionary import lookup
+
+        assert lookup("Sales  Order") is DICTIONARY["sales order"]
+        assert lookup(" CUSTOMER ") is DICTIONARY["customer"]
+        assert lookup("no such term") is None
+
+    def test_dictionary_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            DICTIONARY["new term"] = {}  # type: ignore[index]
+
+    def test_reverse_indexes(self) -> None:
+        """By-model and by-module indexes agree with a full scan."""
+        from odooforge.knowledge.dictionary import DICTIONARY_BY_MODEL, DICTIONARY_BY_MODULE
+
+        for model, terms in DICTIONARY_BY_MODEL.items():
+            assert terms == tuple(t for t, e in DICTIONARY.items() if e["model"] == model)
+        for module, terms in DICTIONARY_BY_MODULE.items():
+            assert terms == tuple(t for t, e in DICTIONARY.items() if e.get("module") == module)
+        assert sum(map(len, DICTIONARY_BY_MODEL.values())) == len(DICTIONARY)
+        assert "customer" in DICTIONARY_BY_MODEL["res.partner"]
 
 
 # ── Patterns knowledge ───────────────────────────────────────────
@@ -233,9 +378,17 @@ class TestBestPracticesKnowledge:
     """Validate the BEST_PRACTICES structure and content."""
 
     def test_structure_validation(self) -> None:
-        """Top-level must have a 'rules' key with a list."""
+        """Top-level must have a 'rules' key with a tuple."""
         assert "rules" in BEST_PRACTICES
-        assert isinstance(BEST_PRACTICES["rules"], list)
+        assert isinstance(BEST_PRACTICES["rules"], tuple)
+
+    def test_behaves_as_mapping(self) -> None:
+        """BEST_PRACTICES stays a drop-in for the old ``{"rules": ...}`` dict."""
+        assert isinstance(BEST_PRACTICES, Mapping)
+        assert list(BEST_PRACTICES) == ["rules"]
+        assert len(BEST_PRACTICES) == 1
+        assert BEST_PRACTICES.get("missing") is None
+        assert dict(BEST_PRACTICES.items()) == dict(BEST_PRACTICES) == {"rules": BEST_PRACTICES["rules"]}
 
     def test_rules_list_exists(self) -> None:
         """Rules list must be non-empty."""
@@ -270,6 +423,13 @@ class TestBestPracticesKnowledge:
             assert len(rule["rule"]) >= 10, f"Rule #{i} text too short"
             assert len(rule["why"]) >= 20, f"Rule #{i} 'why' too short"
 
+    def test_by_category_matches_rules(self) -> None:
+        """Category lookup returns the same rules as filtering the list."""
+        for category in BEST_PRACTICES.categories():
+            expected = tuple(r for r in BEST_PRACTICES["rules"] if r["category"] == category)
+            assert BEST_PRACTICES.by_category(category) == expected
+        assert BEST_PRACTICES.by_category("unknown") == ()
+
 
 # ── Blueprints knowledge ─────────────────────────────────────────
 
@@ -289,6 +449,110 @@ class TestBlueprintsKnowledge:
         }
         assert set(BLUEPRINTS.keys()) == expected_ids
 
+    def test_listing_does_not_import_blueprints(self) -> None:
+        """Blueprint modules are only imported when a blueprint is read."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "from odooforge.knowledge import KnowledgeBase\n"
+            "kb = KnowledgeBase()\n"
+            "assert len(kb.list_blueprints()) == 9\n"
+            "prefix = 'odooforge.knowledge.blueprints.'\n"
+            "loaded = lambda: [m for m in sys.modules if m.startswith(prefix) and '._' not in m]\n"
+            "assert not loaded()\n"
+            "kb.get_blueprint('bakery')\n"
+            "assert loaded() == [prefix + 'bakery']\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_blueprint_constants_resolve_lazily(self) -> None:
+        """``*_BLUEPRINT`` names on the package resolve through the registry."""
+        from odooforge.knowledge import blueprints
+        from odooforge.knowledge.blueprints import RETAIL_BLUEPRINT
+
+        assert RETAIL_BLUEPRINT is BLUEPRINTS["retail"]
+        assert "BAKERY_BLUEPRINT" in dir(blueprints)
+        with pytest.raises(AttributeError):
+            blueprints.UNKNOWN_BLUEPRINT
+
+    def test_module_index_matches_scan(self) -> None:
+        from odooforge.knowledge.blueprints import module_index
+
+        kb = KnowledgeBase()
+        for module in ("hr_attendance", "website_sale", "account"):
+            expected = {
+                bp_id for bp_id, bp in BLUEPRINTS.items()
+                if module in bp["modules"]
+                or any(o["module"] == module for o in bp["optional_modules"])
+            }
+            assert kb.get_blueprints_for_module(module) == expected
+        assert kb.get_blueprints_for_module("no_such_module") == frozenset()
+        assert module_index() is module_index()
+
+    def test_category_ancestors(self) -> None:
+        from odooforge.knowledge.blueprints import category_ancestors
+
+        assert list(category_ancestors("bakery", "Flour")) == ["Flour", "Ingredients"]
+        assert list(category_ancestors("bakery", "Breads")) == ["Breads"]
+        with pytest.raises(KeyError):
+            list(category_ancestors("bakery", "Unknown"))
+
+    def test_shared_optional_modules_are_one_object(self) -> None:
+        from odooforge.knowledge.blueprints._catalog import OPT_HR_HOLIDAYS
+
+        shared = [
+            o for bp in BLUEPRINTS.values()
+            for o in bp["optional_modules"] if o == OPT_HR_HOLIDAYS
+        ]
+        assert len(shared) > 1
+        assert all(o is shared[0] for o in shared)
+
+    def test_sample_product_lookup(self) -> None:
+        from odooforge.knowledge.blueprints import sample_product
+
+        flour = sample_product("bakery", "Bread Flour (25kg)")
+        assert flour is not None and flour["uom"] == "kg"
+        assert sample_product("bakery", "Unobtainium") is None
+        assert sample_product("retail", "Bread Flour (25kg)") is None
+
+    def test_blueprints_are_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            BLUEPRINTS["bakery"]["name"] = "changed"  # type: ignore[index]
+
+    def test_blueprints_are_read_only_at_every_level(self) -> None:
+        bakery = BLUEPRINTS["bakery"]
+        with pytest.raises(TypeError):
+            bakery["settings"]["pos_config"]["changed"] = True  # type: ignore[index]
+        with pytest.raises(TypeError):
+            bakery["models"][0]["model"] = "changed"  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            bakery["models"][0]["fields"].append({})  # type: ignore[attr-defined]
+        with pytest.raises(TypeError):
+            bakery["sample_data"]["products"][0]["name"] = "changed"  # type: ignore[index]
+
+    def test_freezing_leaves_source_literals_alone(self) -> None:
+        import json
+
+        from odooforge.knowledge.blueprints import bakery, thaw
+
+        frozen = BLUEPRINTS["bakery"]
+        source = bakery.BAKERY_BLUEPRINT
+        assert isinstance(source["modules"], list)
+        assert isinstance(source["models"][0], dict)
+        # thaw() gives back JSON-ready plain containers with the same content.
+        assert json.dumps(thaw(frozen), sort_keys=True) == json.dumps(source, sort_keys=True)
+
+    def test_names_are_interned(self) -> None:
+        import sys
+
+        for bp in BLUEPRINTS.values():
+            for name in bp["modules"]:
+                assert name is sys.intern(name)
+            for model in bp.get("models", []):
+                assert model["model"] is sys.intern(model["model"])
+
     def test_structure_validation_per_blueprint(self) -> None:
         """Every blueprint must have the required top-level keys."""
         required_keys = {
@@ -299,14 +563,14 @@ class TestBlueprintsKnowledge:
             missing = required_keys - set(bp.keys())
             assert not missing, f"Blueprint '{bp_id}' missing keys: {missing}"
 
-    def test_modules_is_list(self) -> None:
-        """modules and optional_modules must be lists."""
+    def test_modules_is_tuple(self) -> None:
+        """modules and optional_modules must be tuples."""
         for bp_id, bp in BLUEPRINTS.items():
-            assert isinstance(bp["modules"], list), (
-                f"Blueprint '{bp_id}' modules is not a list"
+            assert isinstance(bp["modules"], tuple), (
+                f"Blueprint '{bp_id}' modules is not a tuple"
             )
-            assert isinstance(bp["optional_modules"], list), (
-                f"Blueprint '{bp_id}' optional_modules is not a list"
+            assert isinstance(bp["optional_modules"], tuple), (
+                f"Blueprint '{bp_id}' optional_modules is not a tuple"
             )
             assert len(bp["modules"]) > 0, (
                 f"Blueprint '{bp_id}' has empty modules list"
@@ -78,6 +78,45 @@ class TestExecute:
             rpc.execute("res.partner", "read", [], max_retries=2)
 
 
+class TestAuthCoalescing:
+    def test_threads_share_one_authentication(self, rpc):
+        import threading
+        import time
+
+        def slow_auth(*args):
+            time.sleep(0.05)
+            return 2
+
+        rpc._common.authenticate.side_effect = slow_auth
+        rpc._object.execute_kw.return_value = []
+        threads = [
+            threading.Thread(target=rpc.execute, args=("res.partner", "read", [1]))
+            for _ in range(4)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert rpc._common.authenticate.call_count == 1
+        assert rpc._object.execute_kw.call_count == 4
+
+
+class TestBackoff:
+    def test_backoff_is_jittered_and_capped(self, rpc):
+        with patch("random.uniform", side_effect=lambda lo, hi: hi) as uniform:
+            assert rpc._backoff(0) == 1
+            assert rpc._backoff(3) == 8
+            assert rpc._backoff(10) == rpc.max_backoff
+        assert all(call.args[0] == 0 for call in uniform.call_args_list)
+
+    def test_sync_retry_sleeps_backoff(self, rpc):
+        rpc._common.authenticate.return_value = 2
+        rpc._object.execute_kw.side_effect = [ConnectionError("lost"), [{"id": 1}]]
+        with patch.object(rpc, "_backoff", return_value=0.25), patch("time.sleep") as sleep:
+            rpc.execute("res.partner", "read", [1])
+        sleep.assert_called_once_with(0.25)
+
+
 class TestConvenienceMethods:
     def test_search_read(self, rpc):
         rpc._common.authenticate.return_value = 2
@@ -163,3 +202,198 @@ class TestDatabaseMethods:
     def test_server_version(self, rpc):
         rpc._common.version.return_value = {"server_version": "18.0"}
         assert rpc.server_version() == "18.0"
+
+
+def _xmlrpc_transport(handler):
+    """An httpx transport that answers XML-RPC calls with handler(service, method, params)."""
+    import httpx
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        params, method = xmlrpc.client.loads(request.content)
+        service = request.url.path.rsplit("/", 1)[-1]
+        try:
+            body = xmlrpc.client.dumps((handler(service, method, params),), methodresponse=True, allow_none=True)
+        except xmlrpc.client.Fault as fault:
+            body = xmlrpc.client.dumps(fault, methodresponse=True)
+        return httpx.Response(200, content=body.encode())
+
+    return httpx.MockTransport(respond)
+
+
+@pytest.fixture
+def async_rpc(rpc):
+    import httpx
+
+    calls = []
+
+    def handler(service, method, params):
+        calls.append((service, method, params))
+        if method == "authenticate":
+            return 2
+        model, model_method = params[3], params[4]
+        if model_method == "fail":
+            raise xmlrpc.client.Fault(2, "Access Denied")
+        return [{"id": 1, "model": model}]
+
+    rpc._http = httpx.AsyncClient(base_url=rpc.url, transport=_xmlrpc_transport(handler))
+    rpc.calls = calls
+    return rpc
+
+
+class TestAsyncExecute:
+    @pytest.mark.asyncio
+    async def test_execute_async_authenticates_once(self, async_rpc):
+        result = await async_rpc.execute_async("res.partner", "search_read", [])
+        await async_rpc.execute_async("res.partner", "search_read", [])
+        assert result == [{"id": 1, "model": "res.partner"}]
+        assert async_rpc.uid == 2
+        assert [c[1] for c in async_rpc.calls] == ["authenticate", "execute_kw", "execute_kw"]
+        assert async_rpc.calls[1][2][:5] == ("testdb", 2, "admin", "res.partner", "search_read")
+        await async_rpc.aclose()
+
+    @pytest.mark.asyncio
+    async def test_execute_async_gather(self, async_rpc):
+        import asyncio
+
+        await async_rpc.authenticate_async()
+        results = await asyncio.gather(*(
+            async_rpc.execute_async(model, "fields_get")
+            for model in ("res.partner", "res.users", "sale.order")
+        ))
+        assert [r[0]["model"] for r in results] == ["res.partner", "res.users", "sale.order"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_cold_calls_authenticate_once(self, rpc):
+        import asyncio
+        import httpx
+
+        methods = []
+
+        async def respond(request):
+            params, method = xmlrpc.client.loads(request.content)
+            methods.append(method)
+            if method == "authenticate":
+                await asyncio.sleep(0.01)  # let the other callers pile up
+            result = 2 if method == "authenticate" else []
+            return httpx.Response(200, content=xmlrpc.client.dumps((result,), methodresponse=True).encode())
+
+        rpc._http = httpx.AsyncClient(base_url=rpc.url, transport=httpx.MockTransport(respond))
+        await asyncio.gather(*(
+            rpc.execute_async("res.partner", "search_read", []) for _ in range(5)
+        ))
+        assert methods.count("authenticate") == 1
+        assert methods.count("execute_kw") == 5
+
+    @pytest.mark.asyncio
+    async def test_execute_async_fault(self, async_rpc):
+        with pytest.raises(OdooRPCError, match="Access Denied"):
+            await async_rpc.execute_async("res.partner", "fail")
+
+    @pytest.mark.asyncio
+    async def test_execute_async_retries_without_blocking(self, rpc):
+        import httpx
+
+        attempts = []
+
+        def respond(request):
+            params, method = xmlrpc.client.loads(request.content)
+            if method == "execute_kw":
+                attempts.append(method)
+                if len(attempts) == 1:
+                    raise httpx.ConnectError("lost")
+            result = 2 if method == "authenticate" else [{"id": 1}]
+            return httpx.Response(200, content=xmlrpc.client.dumps((result,), methodresponse=True).encode())
+
+        rpc._http = httpx.AsyncClient(base_url=rpc.url, transport=httpx.MockTransport(respond))
+        with patch("asyncio.sleep") as sleep:
+            result = await rpc.execute_async("res.partner", "read", [1], max_retries=2)
+        assert result == [{"id": 1}]
+        assert len(attempts) == 2
+        sleep.assert_awaited_once()
+        assert 0 <= sleep.await_args.args[0] <= 1
+
+    @pytest.mark.asyncio
+    async def test_multi_call_async_keeps_order(self, async_rpc):
+        results = await async_rpc.multi_call_async([
+            ("res.partner", "fields_get", [], {"attributes": ["type"]}),
+            ("res.users", "search_read", [[]], {"limit": 5}),
+        ])
+        assert [r[0]["model"] for r in results] == ["res.partner", "res.users"]
+        methods = [c[1] for c in async_rpc.calls]
+        assert methods.count("authenticate") == 1
+        assert methods.count("execute_kw") == 2
+        kw_calls = {c[2][3]: c[2][6] for c in async_rpc.calls if c[1] == "execute_kw"}
+        assert kw_calls["res.users"] == {"limit": 5}
+
+
+class TestTransport:
+    def test_endpoints_share_one_transport(self):
+        with patch("xmlrpc.client.ServerProxy") as mock_proxy:
+            client = OdooRPC(url="http://localhost:8069")
+        assert client._db_proxy() is client._db
+        transports = {id(call.kwargs["transport"]) for call in mock_proxy.call_args_list}
+        assert transports == {id(client._transport)}
+        assert type(client._transport.get()) is xmlrpc.client.Transport
+
+    def test_https_uses_safe_transport(self):
+        client = OdooRPC(url="https://odoo.example.com")
+        assert isinstance(client._transport.get(), xmlrpc.client.SafeTransport)
+
+    def test_each_thread_gets_its_own_transport(self):
+        import threading
+
+        client = OdooRPC(url="http://localhost:8069")
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(client._transport.get()))
+        thread.start()
+        thread.join()
+        assert client._transport.get() is client._transport.get()
+        assert seen[0] is not client._transport.get()
+
+
+@pytest.fixture
+def xmlrpc_server():
+    """A real threaded HTTP/1.1 XML-RPC server exposing Odoo's common/object endpoints."""
+    import socketserver
+    import threading
+    import time
+    from xmlrpc.server import MultiPathXMLRPCServer, SimpleXMLRPCDispatcher, SimpleXMLRPCRequestHandler
+
+    class Handler(SimpleXMLRPCRequestHandler):
+        protocol_version = "HTTP/1.1"
+        rpc_paths = ("/xmlrpc/2/common", "/xmlrpc/2/object")
+
+    class Server(socketserver.ThreadingMixIn, MultiPathXMLRPCServer):
+        daemon_threads = True
+
+    def execute_kw(db, uid, password, model, method, args, kwargs):
+        time.sleep(0.001)  # widen the window for interleaved requests
+        return [model, method, args]
+
+    common = SimpleXMLRPCDispatcher(allow_none=True)
+    common.register_function(lambda db, login, password, ctx: 2, "authenticate")
+    obj = SimpleXMLRPCDispatcher(allow_none=True)
+    obj.register_function(execute_kw, "execute_kw")
+
+    server = Server(("127.0.0.1", 0), requestHandler=Handler, logRequests=False, allow_none=True)
+    server.add_dispatcher("/xmlrpc/2/common", common)
+    server.add_dispatcher("/xmlrpc/2/object", obj)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+class TestConcurrentExecute:
+    def test_threads_get_their_own_responses(self, xmlrpc_server):
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = OdooRPC(url=xmlrpc_server, db="testdb")
+
+        def call(i):
+            return client.execute("res.partner", "read", [i], max_retries=1)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(call, range(200)))
+        assert results == [["res.partner", "read", [[i]]] for i in range(200)]